@@ -12,14 +12,45 @@ Supports loading channel configurations from CSV files including:
 
 import csv
 import logging
-from typing import Dict, List, Optional, Tuple
+import os
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+try:
+    from fastnumbers import fast_float as _fast_float
+except ImportError:  # fastnumbers is optional, fall back to the built-in float()
+    _fast_float = None
 
 logger = logging.getLogger(__name__)
 
+# Sentinel returned by _to_float() for strings that are not valid numbers
+_INVALID_FLOAT = object()
+
+
+def _to_float(value_str: str) -> Union[float, object]:
+    """
+    Convert a string to float, using fastnumbers when it is installed.
+    
+    Both paths accept the same strings as float(), including PEP 515 underscores
+    such as "1_000", so validation does not depend on the optional package.
+    
+    Args:
+        value_str: String to convert.
+        
+    Returns:
+        The parsed float, or _INVALID_FLOAT if the string is not a valid number.
+    """
+    if _fast_float is not None:
+        return _fast_float(value_str, on_fail=_INVALID_FLOAT, allow_underscores=True)
+    try:
+        return float(value_str)
+    except ValueError:
+        return _INVALID_FLOAT
+
 
-@dataclass
+@dataclass(slots=True)
 class ChannelThresholdConfig:
     """Configuration for a single channel including thresholds."""
     channel_num: int
@@ -39,16 +70,63 @@ class ChannelThresholdConfig:
         Returns:
             True if value is within thresholds (or no thresholds set), False otherwise.
         """
-        if self.lower_threshold is None and self.upper_threshold is None:
-            return True  # No thresholds configured
-        
-        if self.lower_threshold is not None and value < self.lower_threshold:
+        # Bounds are read on each call so later changes to the thresholds take effect
+        lower = self.lower_threshold
+        if lower is not None and value < lower:
             return False
-        
-        if self.upper_threshold is not None and value > self.upper_threshold:
-            return False
-        
-        return True
+        upper = self.upper_threshold
+        return upper is None or value <= upper
+
+
+# Sample configuration file content, encoded once at import
+_SAMPLE_CONFIG = """# SDM4055A-SC Channel Configuration File
+# 
+# Format: channel,Name,measurement_type,range,lower_threshold,upper_threshold
+#
+# Columns:
+#   channel: Channel number (1-16)
+#   Name: Custom name for the channel (optional, can be empty)
+#   measurement_type: Measurement type (see valid types below)
+#   range: Measurement range (AUTO or specific value)
+#   lower_threshold: Optional lower threshold (leave empty for no threshold)
+#   upper_threshold: Optional upper threshold (leave empty for no threshold)
+#
+# Valid measurement types:
+#   VOLT:DC - DC Voltage
+#   VOLT:AC - AC Voltage
+#   RES - 2-Wire Resistance
+#   FRES - 4-Wire Resistance
+#   CAP - Capacitance
+#   FREQ - Frequency
+#   DIOD - Diode
+#   CONT - Continuity
+#   TEMP:RTD - RTD Temperature
+#   TEMP:THER - Thermocouple
+#   CURR:DC - DC Current (channels 13-16 only)
+#   CURR:AC - AC Current (channels 13-16 only)
+#
+# Notes:
+#   - Channels 1-12: Voltage, Resistance, Capacitance, etc.
+#   - Channels 13-16: Current measurements only (2A range ONLY)
+#   - CS1016 scanning card has DIFFERENT range limitations than multimeter itself!
+#   - See doc/CS1016_Supported_Ranges.md for detailed information
+#   - Thresholds are optional - leave empty if not needed
+#   - Values within thresholds display in GREEN
+#   - Values outside thresholds display in RED
+#   - You can configure only the channels you need
+#   - Custom names are optional and will be used in report headers
+#   - Whitespace around values is automatically stripped
+
+# Example configurations:
+channel,Name,measurement_type,range,lower_threshold,upper_threshold
+1,+3.3VD,VOLT:DC,AUTO,0,5
+2,+5/0VA,VOLT:DC,200 mV,0,0.2
+3,Test Point 3,VOLT:AC,AUTO,0,120
+4,,RES,AUTO,0,1000
+5,CAP Channel,CAP,AUTO,1e-6,100e-6
+13,Current 1,CURR:DC,2 A,0,0.5
+14,Current 2,CURR:DC,2 A,0,1.5
+""".encode('utf-8')
 
 
 class ConfigLoader:
@@ -64,6 +142,10 @@ class ConfigLoader:
         "TEMP:RTD", "TEMP:THER"
     }
     
+    # Measurement types allowed on current channels (13-16) and on all other channels (1-12)
+    _CURRENT_TYPES = frozenset({"CURR:DC", "CURR:AC"})
+    _NON_CURRENT_TYPES = frozenset(VALID_MEASUREMENT_TYPES - _CURRENT_TYPES)
+    
     # Valid ranges for each measurement type (CS1016 scanning card limitations)
     # IMPORTANT: CS1016 scanning card has DIFFERENT range limitations than multimeter itself!
     # See doc/CS1016_Supported_Ranges.md for detailed information
@@ -82,6 +164,16 @@ class ConfigLoader:
         "CAP": ["2 nF", "20 nF", "200 nF", "2 uF", "20 uF", "200 uF", "10000 uF", "AUTO"],
     }
     
+    # Case-insensitive range lookup (upper-cased range -> canonical range) per measurement type
+    _RANGE_LOOKUP = {
+        mt: {r.upper(): r for r in ranges} for mt, ranges in VALID_RANGES.items()
+    }
+    
+    # Pre-formatted list of valid ranges per measurement type (for validation messages)
+    _VALID_RANGES_SORTED_STR = {
+        mt: ', '.join(sorted(ranges)) for mt, ranges in VALID_RANGES.items()
+    }
+    
     # User-friendly names for measurement types (for validation messages)
     MEASUREMENT_TYPE_NAMES = {
         "VOLT:DC": "DC Voltage",
@@ -98,6 +190,22 @@ class ConfigLoader:
         "TEMP:THER": "Thermocouple"
     }
     
+    # Pre-formatted list of valid measurement type names (for validation messages)
+    _VALID_TYPES_STR = ', '.join(sorted(MEASUREMENT_TYPE_NAMES.values()))
+    
+    # Columns that every configuration file must contain
+    _REQUIRED_COLUMNS = frozenset({'channel', 'measurement_type', 'range'})
+    
+    # Canonical header layouts, parsed positionally (with and without the optional Name column)
+    _EXPECTED_HEADER = ['channel', 'Name', 'measurement_type', 'range', 'lower_threshold', 'upper_threshold']
+    _EXPECTED_HEADER_NO_NAME = ['channel', 'measurement_type', 'range', 'lower_threshold', 'upper_threshold']
+    _ROW_PADDING = [''] * len(_EXPECTED_HEADER)
+    
+    # Parsed configurations of recently loaded files, keyed by (resolved path, mtime_ns, size).
+    # Shared by all loaders so reloading an unchanged file skips parsing.
+    _PARSE_CACHE_SIZE = 8
+    _PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[int, ChannelThresholdConfig]]" = OrderedDict()
+    
     def __init__(self):
         """Initialize configuration loader."""
         self.configs: Dict[int, ChannelThresholdConfig] = {}
@@ -114,41 +222,91 @@ class ConfigLoader:
             Tuple of (success: bool, message: str)
         """
         try:
-            path = Path(file_path)
-            if not path.exists():
+            # Single stat call for both the existence check and the cache key
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
                 return False, f"File not found: {file_path}"
             
-            if not path.suffix.lower() == '.csv':
+            if not str(file_path).lower().endswith('.csv'):
                 return False, "Configuration file must be a .csv file"
             
             self.configs.clear()
-            self.config_file_path = path
+            self.config_file_path = Path(file_path)
             
-            with open(path, 'r', encoding='utf-8') as f:
-                # Read all lines and filter out comment lines
-                lines = []
-                for line in f:
-                    stripped = line.strip()
-                    # Skip empty lines and comment lines
-                    if stripped and not stripped.startswith('#'):
-                        lines.append(line)
-                
-                # Create CSV reader from filtered lines
-                reader = csv.DictReader(lines)
+            # Reuse the parsed result if this exact file version was loaded before
+            cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+            cached = self._PARSE_CACHE.get(cache_key)
+            if cached is not None:
+                self._PARSE_CACHE.move_to_end(cache_key)
+                self.configs.update({ch: replace(cfg) for ch, cfg in cached.items()})
+                logger.info(f"Loaded {len(self.configs)} channel configurations from {file_path} (cached)")
+                return True, f"Loaded {len(self.configs)} channel configurations"
+            
+            with open(file_path, 'r', encoding='utf-8', newline='') as f:
+                # Stream data lines straight into the CSV reader, skipping empty and comment lines
+                reader = csv.reader(
+                    line for line in f
+                    if (stripped := line.lstrip()) and not stripped.startswith('#')
+                )
+                header = next(reader, [])
+                col_idx = {name: i for i, name in enumerate(header)}
                 
                 # Validate required columns
-                required_columns = ['channel', 'measurement_type', 'range']
-                if not all(col in reader.fieldnames for col in required_columns):
-                    return False, f"CSV must contain columns: {', '.join(required_columns)}"
+                missing_columns = self._REQUIRED_COLUMNS - col_idx.keys()
+                if missing_columns:
+                    return False, f"CSV is missing required columns: {', '.join(sorted(missing_columns))}"
+                
+                # Fast path: canonical layouts are unpacked positionally, anything else
+                # (reordered or extra columns) goes through the column index lookups
+                fast_with_name = header == self._EXPECTED_HEADER
+                fast_no_name = header == self._EXPECTED_HEADER_NO_NAME
+                padding = self._ROW_PADDING
+                
+                # Column positions (Name column is optional, for backward compatibility)
+                channel_idx = col_idx['channel']
+                name_idx = col_idx.get('Name', col_idx.get('name'))
+                type_idx = col_idx['measurement_type']
+                range_idx = col_idx['range']
+                lower_idx = col_idx.get('lower_threshold')
+                upper_idx = col_idx.get('upper_threshold')
                 
-                # Check if Name column exists (optional, for backward compatibility)
-                has_name_column = 'Name' in reader.fieldnames or 'name' in reader.fieldnames
+                def cell(row: List[str], i: Optional[int]) -> str:
+                    """Return the stripped cell of a row, or '' if the column is absent."""
+                    if i is None or i >= len(row):
+                        return ''
+                    return row[i].strip()
+                
+                def parse_opt_float(value_str: str, label: str, row_num: int) -> Tuple[Optional[float], Optional[str]]:
+                    """Parse an optional float cell into (value, error message)."""
+                    if not value_str:
+                        return None, None
+                    value = _to_float(value_str)
+                    if value is _INVALID_FLOAT:
+                        return None, f"Row {row_num}: Invalid {label} '{value_str}'"
+                    return value, None
                 
                 # Parse each row
                 for row_num, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
                     try:
+                        if fast_with_name:
+                            channel_str, name, type_str, range_value_input, lower_str, upper_str = (
+                                value.strip() for value in (row + padding)[:6]
+                            )
+                        elif fast_no_name:
+                            channel_str, type_str, range_value_input, lower_str, upper_str = (
+                                value.strip() for value in (row + padding)[:5]
+                            )
+                            name = ''
+                        else:
+                            channel_str = cell(row, channel_idx)
+                            name = cell(row, name_idx)
+                            type_str = cell(row, type_idx)
+                            range_value_input = cell(row, range_idx)
+                            lower_str = cell(row, lower_idx)
+                            upper_str = cell(row, upper_idx)
+                        
                         # Skip empty rows
-                        channel_str = row.get('channel', '').strip()
                         if not channel_str:
                             continue
                         
@@ -161,63 +319,40 @@ class ConfigLoader:
                         if channel_num < 1 or channel_num > 16:
                             return False, f"Row {row_num}: Channel number must be between 1 and 16"
                         
-                        # Parse custom name (optional, strip whitespace)
-                        name = ''
-                        if has_name_column:
-                            name = row.get('Name', row.get('name', '')).strip()
-                        
                         # Parse measurement type
-                        measurement_type = row.get('measurement_type', '').strip().upper()
+                        measurement_type = type_str.upper()
                         if measurement_type not in self.VALID_MEASUREMENT_TYPES:
-                            valid_types = ', '.join(sorted(self.MEASUREMENT_TYPE_NAMES.values()))
-                            return False, f"Row {row_num}: Invalid measurement type '{measurement_type}'. Valid types: {valid_types}"
+                            return False, f"Row {row_num}: Invalid measurement type '{measurement_type}'. Valid types: {self._VALID_TYPES_STR}"
                         
                         # Validate measurement type for channel
-                        if channel_num <= 12:
-                            # Channels 1-12: voltage/resistance/capacitance only
-                            if measurement_type in ['CURR:DC', 'CURR:AC']:
-                                return False, f"Row {row_num}: Current measurements not supported on channel {channel_num} (channels 1-12)"
-                        else:
-                            # Channels 13-16: current only
-                            if measurement_type not in ['CURR:DC', 'CURR:AC']:
+                        # Channels 1-12: voltage/resistance/capacitance only, channels 13-16: current only
+                        is_current_channel = channel_num > 12
+                        allowed = self._CURRENT_TYPES if is_current_channel else self._NON_CURRENT_TYPES
+                        if measurement_type not in allowed:
+                            if is_current_channel:
                                 return False, f"Row {row_num}: Only current measurements supported on channel {channel_num} (channels 13-16)"
+                            return False, f"Row {row_num}: Current measurements not supported on channel {channel_num} (channels 1-12)"
                         
                         # Parse range (case-insensitive, but preserve correct case)
-                        range_value_input = row.get('range', 'AUTO').strip()
                         if not range_value_input:
                             range_value = 'AUTO'
                         elif range_value_input.upper() == 'AUTO':
                             range_value = 'AUTO'
                         else:
                             # Find matching range (case-insensitive)
-                            measurement_type_valid_ranges = self.VALID_RANGES.get(measurement_type, [])
-                            range_value = None
-                            for valid_range in measurement_type_valid_ranges:
-                                if valid_range.upper() == range_value_input.upper():
-                                    range_value = valid_range
-                                    break
+                            range_value = self._RANGE_LOOKUP.get(measurement_type, {}).get(range_value_input.upper())
                             
                             if range_value is None:
-                                valid_ranges = ', '.join(sorted(measurement_type_valid_ranges))
+                                valid_ranges = self._VALID_RANGES_SORTED_STR.get(measurement_type, '')
                                 return False, f"Row {row_num}: Invalid range '{range_value_input}' for measurement type '{measurement_type}'. Valid ranges: {valid_ranges}"
                         
-                        # Parse lower threshold (optional)
-                        lower_threshold = None
-                        lower_str = row.get('lower_threshold', '').strip()
-                        if lower_str:
-                            try:
-                                lower_threshold = float(lower_str)
-                            except ValueError:
-                                return False, f"Row {row_num}: Invalid lower threshold '{lower_str}'"
-                        
-                        # Parse upper threshold (optional)
-                        upper_threshold = None
-                        upper_str = row.get('upper_threshold', '').strip()
-                        if upper_str:
-                            try:
-                                upper_threshold = float(upper_str)
-                            except ValueError:
-                                return False, f"Row {row_num}: Invalid upper threshold '{upper_str}'"
+                        # Parse thresholds (optional)
+                        lower_threshold, error = parse_opt_float(lower_str, 'lower threshold', row_num)
+                        if error:
+                            return False, error
+                        upper_threshold, error = parse_opt_float(upper_str, 'upper threshold', row_num)
+                        if error:
+                            return False, error
                         
                         # Validate threshold consistency
                         if lower_threshold is not None and upper_threshold is not None:
@@ -246,6 +381,11 @@ class ConfigLoader:
             if not self.configs:
                 return False, "No valid channel configurations found in file"
             
+            # Cache a private copy so later changes to self.configs don't leak into it
+            self._PARSE_CACHE[cache_key] = {ch: replace(cfg) for ch, cfg in self.configs.items()}
+            if len(self._PARSE_CACHE) > self._PARSE_CACHE_SIZE:
+                self._PARSE_CACHE.popitem(last=False)
+            
             logger.info(f"Successfully loaded {len(self.configs)} channel configurations from {file_path}")
             return True, f"Loaded {len(self.configs)} channel configurations"
             
@@ -310,57 +450,7 @@ class ConfigLoader:
             Tuple of (success: bool, message: str)
         """
         try:
-            sample_content = """# SDM4055A-SC Channel Configuration File
-# 
-# Format: channel,Name,measurement_type,range,lower_threshold,upper_threshold
-#
-# Columns:
-#   channel: Channel number (1-16)
-#   Name: Custom name for the channel (optional, can be empty)
-#   measurement_type: Measurement type (see valid types below)
-#   range: Measurement range (AUTO or specific value)
-#   lower_threshold: Optional lower threshold (leave empty for no threshold)
-#   upper_threshold: Optional upper threshold (leave empty for no threshold)
-#
-# Valid measurement types:
-#   VOLT:DC - DC Voltage
-#   VOLT:AC - AC Voltage
-#   RES - 2-Wire Resistance
-#   FRES - 4-Wire Resistance
-#   CAP - Capacitance
-#   FREQ - Frequency
-#   DIOD - Diode
-#   CONT - Continuity
-#   TEMP:RTD - RTD Temperature
-#   TEMP:THER - Thermocouple
-#   CURR:DC - DC Current (channels 13-16 only)
-#   CURR:AC - AC Current (channels 13-16 only)
-#
-# Notes:
-#   - Channels 1-12: Voltage, Resistance, Capacitance, etc.
-#   - Channels 13-16: Current measurements only (2A range ONLY)
-#   - CS1016 scanning card has DIFFERENT range limitations than multimeter itself!
-#   - See doc/CS1016_Supported_Ranges.md for detailed information
-#   - Thresholds are optional - leave empty if not needed
-#   - Values within thresholds display in GREEN
-#   - Values outside thresholds display in RED
-#   - You can configure only the channels you need
-#   - Custom names are optional and will be used in report headers
-#   - Whitespace around values is automatically stripped
-
-# Example configurations:
-channel,Name,measurement_type,range,lower_threshold,upper_threshold
-1,+3.3VD,VOLT:DC,AUTO,0,5
-2,+5/0VA,VOLT:DC,200 mV,0,0.2
-3,Test Point 3,VOLT:AC,AUTO,0,120
-4,,RES,AUTO,0,1000
-5,CAP Channel,CAP,AUTO,1e-6,100e-6
-13,Current 1,CURR:DC,2 A,0,0.5
-14,Current 2,CURR:DC,2 A,0,1.5
-"""
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(sample_content)
+            Path(file_path).write_bytes(_SAMPLE_CONFIG)
             
             logger.info(f"Created sample configuration file: {file_path}")
             return True, f"Sample configuration file created: {file_path}"
@@ -3,12 +3,15 @@ Theme Manager for SDM4055A-SC multimeter controller.
 Manages theme switching and persistence.
 """
 
+import logging
 from typing import Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import QSettings
 from qt_material import apply_stylesheet
 
+logger = logging.getLogger(__name__)
+
 
 class ThemeManager(QObject):
     """
@@ -18,6 +21,9 @@ class ThemeManager(QObject):
     # Signal emitted when theme changes
     theme_changed = Signal(str)  # Emits "dark" or "light"
 
+    # qt-material theme file for each supported theme
+    _THEME_XML = {"dark": "dark_teal.xml", "light": "light_teal.xml"}
+
     def __init__(self, app: QApplication, parent: Optional[QObject] = None):
         """
         Initialize theme manager.
@@ -31,23 +37,29 @@ class ThemeManager(QObject):
         self._current_theme = "dark"  # Default theme
         self._settings = QSettings("SDM4055A-SC", "Controller")
 
+        # Coalesce settings flushes so rapid theme toggles result in a single disk write
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(500)
+        self._sync_timer.timeout.connect(self._settings.sync)
+
         # Load saved theme preference
         self._load_theme_preference()
 
     def _load_theme_preference(self) -> None:
         """Load theme preference from QSettings."""
         saved_theme = self._settings.value("theme", "dark")
-        if saved_theme in ["dark", "light"]:
+        if saved_theme in self._THEME_XML:
             self._current_theme = saved_theme
         else:
             self._current_theme = "dark"
-        print(f"Loaded theme preference: {self._current_theme}")
+        logger.debug("Loaded theme preference: %s", self._current_theme)
 
     def _save_theme_preference(self) -> None:
         """Save theme preference to QSettings."""
         self._settings.setValue("theme", self._current_theme)
-        self._settings.sync()
-        print(f"Saved theme preference: {self._current_theme}")
+        self._sync_timer.start()
+        logger.debug("Saved theme preference: %s", self._current_theme)
 
     def get_current_theme(self) -> str:
         """
@@ -62,20 +74,24 @@ class ThemeManager(QObject):
         """
         Set application theme.
 
+        Does nothing if the theme is already active; use apply_initial_theme()
+        to force re-applying the current theme.
+
         Args:
             theme: Theme string ("dark" or "light").
         """
-        if theme not in ["dark", "light"]:
-            print(f"Invalid theme: {theme}, using dark theme")
+        if theme not in self._THEME_XML:
+            logger.warning("Invalid theme: %s, using dark theme", theme)
             theme = "dark"
 
+        # Re-applying the same stylesheet would re-polish every widget for nothing
+        if theme == self._current_theme:
+            return
+
         self._current_theme = theme
 
         # Apply qt-material theme
-        if theme == "dark":
-            apply_stylesheet(self._app, theme='dark_teal.xml')
-        else:
-            apply_stylesheet(self._app, theme='light_teal.xml')
+        apply_stylesheet(self._app, theme=self._THEME_XML[theme])
 
         # Save preference
         self._save_theme_preference()
@@ -83,7 +99,7 @@ class ThemeManager(QObject):
         # Emit signal
         self.theme_changed.emit(theme)
 
-        print(f"Applied theme: {theme}")
+        logger.debug("Applied theme: %s", theme)
 
     def toggle_theme(self) -> None:
         """Toggle between dark and light themes."""
@@ -92,8 +108,5 @@ class ThemeManager(QObject):
 
     def apply_initial_theme(self) -> None:
         """Apply the initial theme based on saved preference."""
-        if self._current_theme == "dark":
-            apply_stylesheet(self._app, theme='dark_teal.xml')
-        else:
-            apply_stylesheet(self._app, theme='light_teal.xml')
-        print(f"Applied initial theme: {self._current_theme}")
+        apply_stylesheet(self._app, theme=self._THEME_XML[self._current_theme])
+        logger.debug("Applied initial theme: %s", self._current_theme)
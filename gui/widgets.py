@@ -3,14 +3,316 @@ Custom GUI widgets for SDM4055A-SC multimeter controller.
 """
 
 import logging
+import sys
+from contextlib import contextmanager
 from datetime import datetime
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QComboBox,
-    QTextEdit, QPushButton, QDialog, QToolBar, QCheckBox, QGridLayout
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
+    QTextEdit, QPushButton, QDialog, QCheckBox, QGridLayout
 )
-from PySide6.QtCore import Qt, Signal, QObject
-from PySide6.QtGui import QFont, QPalette, QColor, QTextCursor
-from typing import Optional
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QSignalBlocker
+from PySide6.QtGui import QFont, QColor, QTextCursor, QStandardItemModel, QStandardItem
+from typing import Final, Iterable, Iterator, Optional
+
+
+# Card stylesheets, shared by all indicator instances
+_DIGITAL_CARD_QSS_DARK: Final[str] = """
+DigitalIndicator {
+    background-color: #2d2d2d;
+    border-radius: 10px;
+    border: 1px solid #3d3d3d;
+}
+DigitalIndicator QLabel#status[error="true"] {
+    color: #ff6b6b;
+}
+DigitalIndicator QLabel#status[error="false"] {
+    color: #51cf66;
+}
+"""
+
+_DIGITAL_CARD_QSS_LIGHT: Final[str] = """
+DigitalIndicator {
+    background-color: #f5f5f5;
+    border-radius: 10px;
+    border: 1px solid #d0d0d0;
+}
+DigitalIndicator QLabel#status[error="true"] {
+    color: #ff6b6b;
+}
+DigitalIndicator QLabel#status[error="false"] {
+    color: #51cf66;
+}
+"""
+
+_CHANNEL_CARD_QSS_DARK: Final[str] = """
+ChannelIndicator {
+    background-color: #2d2d2d;
+    border-radius: 10px;
+    border: 1px solid #3d3d3d;
+}
+"""
+
+_CHANNEL_CARD_QSS_LIGHT: Final[str] = """
+ChannelIndicator {
+    background-color: #f5f5f5;
+    border-radius: 10px;
+    border: 1px solid #d0d0d0;
+}
+"""
+
+# Card rules for both indicator kinds, applied once to a common ancestor by apply_card_styles()
+_CARD_QSS: Final[dict] = {
+    "dark": _DIGITAL_CARD_QSS_DARK + _CHANNEL_CARD_QSS_DARK,
+    "light": _DIGITAL_CARD_QSS_LIGHT + _CHANNEL_CARD_QSS_LIGHT,
+}
+
+# Channel card combo box rules, applied once through the main window stylesheet
+# instead of being parsed separately by every ChannelIndicator
+CHANNEL_COMBO_QSS_DARK: Final[str] = """
+ChannelIndicator QComboBox {
+    background-color: #3d3d3d;
+    color: #ffffff;
+    border: 1px solid #4d4d4d;
+    border-radius: 4px;
+    padding: 5px;
+    min-height: 25px;
+}
+ChannelIndicator QComboBox:hover {
+    background-color: #4d4d4d;
+}
+ChannelIndicator QComboBox::drop-down {
+    border: none;
+}
+ChannelIndicator QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid #ffffff;
+    margin-right: 5px;
+}
+ChannelIndicator QComboBox QAbstractItemView {
+    background-color: #3d3d3d;
+    color: #ffffff;
+    selection-background-color: #4a9eff;
+    border: 1px solid #4d4d4d;
+}
+"""
+
+CHANNEL_COMBO_QSS_LIGHT: Final[str] = """
+ChannelIndicator QComboBox {
+    background-color: #ffffff;
+    color: #000000;
+    border: 1px solid #b0b0b0;
+    border-radius: 4px;
+    padding: 5px;
+    min-height: 25px;
+}
+ChannelIndicator QComboBox:hover {
+    background-color: #f0f0f0;
+}
+ChannelIndicator QComboBox::drop-down {
+    border: none;
+}
+ChannelIndicator QComboBox::down-arrow {
+    image: none;
+    border-left: 5px solid transparent;
+    border-right: 5px solid transparent;
+    border-top: 5px solid #000000;
+    margin-right: 5px;
+}
+ChannelIndicator QComboBox QAbstractItemView {
+    background-color: #ffffff;
+    color: #000000;
+    selection-background-color: #4a9eff;
+    border: 1px solid #b0b0b0;
+}
+"""
+
+
+def apply_card_styles(root: QWidget, theme: str = "dark") -> None:
+    """
+    Apply the indicator card stylesheet to a widget tree in a single polish pass.
+
+    Indicators don't style themselves on construction; call this once on a common
+    ancestor after all cards are added (or on a single standalone indicator).
+
+    Args:
+        root: Ancestor widget of the indicator cards.
+        theme: Theme string ("dark" or "light").
+    """
+    theme = "dark" if theme == "dark" else "light"
+    root.setStyleSheet(_CARD_QSS[theme] + ChannelIndicator._VALUE_QSS[theme])
+
+
+@contextmanager
+def batched_updates(widgets: Iterable[QWidget]) -> Iterator[None]:
+    """
+    Suspend repaints of several widgets while updating them, then repaint each once.
+
+    Args:
+        widgets: Widgets to update together.
+    """
+    widgets = list(widgets)
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            # Re-enabling updates schedules a single repaint of the widget
+            widget.setUpdatesEnabled(True)
+
+
+def _value_format(unit: str, decimals: int = 6) -> str:
+    """
+    Build the %-format template for a fixed-point value followed by its unit.
+
+    Args:
+        unit: Unit string to display.
+        decimals: Number of decimal places.
+
+    Returns:
+        Format template, e.g. "%.6f V".
+    """
+    return "%%.%df %s" % (decimals, unit.replace("%", "%%"))
+
+
+def _intern_keys(mapping: dict) -> dict:
+    """Return a copy of a lookup table with interned string keys."""
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
+def _build_range_info(range_units: dict, conversions: dict) -> dict:
+    """
+    Fuse the range unit and conversion tables into one lookup.
+
+    Args:
+        range_units: Mapping of range value to display unit.
+        conversions: Mapping of range value to value conversion factor.
+
+    Returns:
+        Dictionary mapping range value to (display unit, conversion factor).
+    """
+    return {range_value: (unit, conversions.get(range_value, 1))
+            for range_value, unit in range_units.items()}
+
+
+# Fonts shared across all widgets in this module, keyed by their attributes
+_FONT_CACHE = {}
+
+
+def _shared_font(point_size: int, bold: bool = False, italic: bool = False, monospace: bool = False) -> QFont:
+    """
+    Return a shared QFont with the given attributes, creating it on first use.
+
+    Fonts are created lazily because QFont needs a QApplication; Qt shares font data
+    between widgets, so one instance per role is enough.
+
+    Args:
+        point_size: Font size in points.
+        bold: Bold weight.
+        italic: Italic style.
+        monospace: Monospace value font (font merging disabled, values are plain ASCII).
+
+    Returns:
+        Shared QFont instance.
+    """
+    key = (point_size, bold, italic, monospace)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QFont()
+        font.setPointSize(point_size)
+        font.setBold(bold)
+        font.setItalic(italic)
+        if monospace:
+            font.setFamily("Consolas, Courier New, monospace")
+            # Skip Qt's per-glyph fallback font lookup
+            font.setStyleStrategy(QFont.StyleStrategy.NoFontMerging | QFont.StyleStrategy.PreferMatch)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Parsed QColor per hex string, shared by all widgets
+_COLOR_CACHE = {}
+
+
+def _shared_color(name: str) -> QColor:
+    """
+    Return a shared QColor for a color string, parsing it on first use.
+
+    Args:
+        name: Color string such as "#ff6b6b".
+
+    Returns:
+        Shared QColor instance.
+    """
+    color = _COLOR_CACHE.get(name)
+    if color is None:
+        color = _COLOR_CACHE[name] = QColor(name)
+    return color
+
+
+def _value_label_qss(font_size: int, green: str, red: str) -> str:
+    """
+    Build the ChannelIndicator value and threshold label rules, with one color rule per "state" property.
+
+    Args:
+        font_size: Value font size in points.
+        green: Color for values within thresholds.
+        red: Color for values outside thresholds.
+
+    Returns:
+        Stylesheet string.
+    """
+    return f"""
+ChannelIndicator QLabel#value {{
+    font-size: {font_size}pt;
+    font-weight: bold;
+    font-family: 'Consolas', 'Courier New', monospace;
+}}
+ChannelIndicator QLabel#value[state="error"] {{ color: #ff6b6b; }}
+ChannelIndicator QLabel#value[state="ok"] {{ color: #51cf66; }}
+ChannelIndicator QLabel#value[state="in_range"] {{ color: {green}; }}
+ChannelIndicator QLabel#value[state="out_of_range"] {{ color: {red}; }}
+ChannelIndicator QLabel#thresholds {{ color: #888; }}
+"""
+
+
+class _CardLabel(QLabel):
+    """
+    Plain-text indicator label configured in a single constructor call.
+
+    setText() is skipped when the label already shows the same text.
+    """
+
+    def __init__(self, text: str, font: QFont, align: Qt.AlignmentFlag, parent=None):
+        """
+        Initialize card label.
+
+        Args:
+            text: Initial text.
+            font: Shared font for the label.
+            align: Text alignment.
+            parent: Parent widget.
+        """
+        super().__init__(text, parent)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        self.setFont(font)
+        self.setAlignment(align)
+        # Text object currently shown
+        self.last_text = text
+
+    def setText(self, text: str) -> None:
+        """
+        Set the label text unless it is already shown.
+
+        Args:
+            text: Text to display.
+        """
+        if text == self.last_text:
+            return
+        self.last_text = text
+        super().setText(text)
 
 
 class DigitalIndicator(QWidget):
@@ -21,6 +323,11 @@ class DigitalIndicator(QWidget):
 
     value_changed = Signal(float)  # Signal emitted when value changes
 
+    # Fonts shared by all instances (created on first use, QFont needs a QApplication)
+    _TITLE_FONT: Optional[QFont] = None
+    _VALUE_FONT: Optional[QFont] = None
+    _STATUS_FONT: Optional[QFont] = None
+
     def __init__(self, title: str = "Measurement", parent=None):
         """
         Initialize digital indicator.
@@ -33,56 +340,42 @@ class DigitalIndicator(QWidget):
 
         self._value = 0.0
         self._title = title
+        # (value rounded to display precision, unit) currently shown
+        self._shown_key = None
 
         # Setup UI
         self._setup_ui()
 
+    @classmethod
+    def _ensure_fonts(cls) -> None:
+        """Create the shared fonts on first instantiation."""
+        if cls._TITLE_FONT is not None:
+            return
+        cls._TITLE_FONT = _shared_font(12, bold=True)
+        cls._VALUE_FONT = _shared_font(32, bold=True, monospace=True)
+        cls._STATUS_FONT = _shared_font(10)
+
     def _setup_ui(self) -> None:
         """Setup widget's UI components."""
+        self._ensure_fonts()
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(10)
 
         # Title label
-        self.title_label = QLabel(self._title)
-        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(12)
-        title_font.setBold(True)
-        self.title_label.setFont(title_font)
+        self.title_label = _CardLabel(self._title, self._TITLE_FONT, Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.title_label)
 
         # Value label
-        self.value_label = QLabel("0.0000 V")
-        self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        value_font = QFont()
-        value_font.setPointSize(32)
-        value_font.setBold(True)
-        value_font.setFamily("Consolas, Courier New, monospace")
-        self.value_label.setFont(value_font)
+        self.value_label = _CardLabel("0.0000 V", self._VALUE_FONT, Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(self.value_label)
 
         # Status label
-        self.status_label = QLabel("Disconnected")
-        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        status_font = QFont()
-        status_font.setPointSize(10)
-        self.status_label.setFont(status_font)
+        self.status_label = _CardLabel("Disconnected", self._STATUS_FONT, Qt.AlignmentFlag.AlignCenter)
+        # Status colors come from the card stylesheet, keyed on the "error" property
+        self.status_label.setObjectName("status")
         layout.addWidget(self.status_label)
 
-        # Apply card style
-        self._apply_card_style()
-
-    def _apply_card_style(self) -> None:
-        """Apply card-style appearance with shadow effects."""
-        self.setStyleSheet("""
-            DigitalIndicator {
-                background-color: #2d2d2d;
-                border-radius: 10px;
-                border: 1px solid #3d3d3d;
-            }
-        """)
-
     def update_theme(self, theme: str) -> None:
         """
         Update widget theme.
@@ -91,32 +384,27 @@ class DigitalIndicator(QWidget):
             theme: Theme string ("dark" or "light").
         """
         if theme == "dark":
-            self.setStyleSheet("""
-                DigitalIndicator {
-                    background-color: #2d2d2d;
-                    border-radius: 10px;
-                    border: 1px solid #3d3d3d;
-                }
-            """)
+            self.setStyleSheet(_DIGITAL_CARD_QSS_DARK)
         else:
-            self.setStyleSheet("""
-                DigitalIndicator {
-                    background-color: #f5f5f5;
-                    border-radius: 10px;
-                    border: 1px solid #d0d0d0;
-                }
-            """)
+            self.setStyleSheet(_DIGITAL_CARD_QSS_LIGHT)
 
     def set_value(self, value: float, unit: str = "V") -> None:
         """
         Update the displayed value.
+        
+        Readings that only differ below the displayed precision are stored but
+        neither redrawn nor emitted.
 
         Args:
             value: New measurement value.
             unit: Unit string to display.
         """
         self._value = value
-        self.value_label.setText(f"{value:.6f} {unit}")
+        key = (round(value, 6), unit)
+        if key == self._shown_key:
+            return
+        self._shown_key = key
+        self.value_label.setText("%.6f %s" % (value, unit))
         self.value_changed.emit(value)
 
     def set_title(self, title: str) -> None:
@@ -138,10 +426,12 @@ class DigitalIndicator(QWidget):
             error: If True, display status in red color.
         """
         self.status_label.setText(status)
-        if error:
-            self.status_label.setStyleSheet("color: #ff6b6b;")
-        else:
-            self.status_label.setStyleSheet("color: #51cf66;")
+        if self.status_label.property("error") != error:
+            # Re-polish to pick up the matching rule; no stylesheet re-parse
+            self.status_label.setProperty("error", error)
+            style = self.status_label.style()
+            style.unpolish(self.status_label)
+            style.polish(self.status_label)
 
     def get_value(self) -> float:
         """Get current displayed value."""
@@ -157,11 +447,16 @@ class ChannelIndicator(QWidget):
     # Font size constants for easy customization
     VALUE_FONT_SIZE = 14 # Size of measurement value font (in points)
     
+    # Fonts shared by all instances (created on first use, QFont needs a QApplication)
+    _CHANNEL_FONT: Optional[QFont] = None
+    _VALUE_FONT: Optional[QFont] = None
+    _THRESH_FONT: Optional[QFont] = None
+    
     measurement_type_changed = Signal(int, str)  # Signal emitted when measurement type changes (channel_num, type)
     range_changed = Signal(int, str)  # Signal emitted when range changes (channel_num, range_value)
 
     # Mapping of measurement types to display units
-    MEASUREMENT_TYPE_TO_UNIT = {
+    MEASUREMENT_TYPE_TO_UNIT = _intern_keys({
         "VOLT:DC": "V",
         "VOLT:AC": "V",
         "CURR:DC": "A",
@@ -174,10 +469,10 @@ class ChannelIndicator(QWidget):
         "CONT": "Ohm",
         "TEMP:RTD": "C",
         "TEMP:THER": "C"
-    }
+    })
 
     # Mapping of ranges to display units for each measurement type (CS1016 supported ranges only)
-    RANGE_TO_UNIT = {
+    RANGE_TO_UNIT = _intern_keys({
         # Voltage ranges (CS1016 only supports up to 200V)
         "200 mV": "mV",
         "2 V": "V",
@@ -201,11 +496,11 @@ class ChannelIndicator(QWidget):
         "2 MOhm": "MOhm",
         "10 MOhm": "MOhm",
         "100 MOhm": "MOhm",
-    }
+    })
 
     # Mapping of ranges to value conversion factors (device returns values in base units)
     # CS1016 supported ranges only
-    RANGE_TO_CONVERSION = {
+    RANGE_TO_CONVERSION = _intern_keys({
         # Voltage ranges (device returns V)
         "200 mV": 1000,  # Convert V to mV (multiply by 1000)
         "2 V": 1,        # No conversion (V to V)
@@ -230,6 +525,20 @@ class ChannelIndicator(QWidget):
         "2 MOhm": 1e-6,  # Convert Ohm to MOhm (multiply by 0.000001)
         "10 MOhm": 1e-6,  # Convert Ohm to MOhm (multiply by 0.000001)
         "100 MOhm": 1e-6, # Convert Ohm to MOhm (multiply by 0.000001)
+    })
+
+    # Fixed range -> (display unit, conversion factor), fused from the two tables above so a
+    # range change needs one lookup; AUTO is absent and uses the measurement type unit
+    _RANGE_INFO = _build_range_info(RANGE_TO_UNIT, RANGE_TO_CONVERSION)
+
+    # Value label rules per theme, built once and applied with the card rules by
+    # apply_card_styles(). The font is repeated so theme stylesheets don't override it;
+    # colors are selected by the label's "state" property, so status and threshold changes
+    # only re-polish the label instead of re-parsing a new stylesheet.
+    # Threshold colors use darker shades on the light theme for better contrast.
+    _VALUE_QSS = {
+        "dark": _value_label_qss(VALUE_FONT_SIZE, green="#51cf66", red="#ff6b6b"),
+        "light": _value_label_qss(VALUE_FONT_SIZE, green="#2e7d32", red="#c62828"),
     }
 
     # Valid ranges for each measurement type (CS1016 scanning card limitations)
@@ -237,18 +546,47 @@ class ChannelIndicator(QWidget):
     # See doc/CS1016_Supported_Ranges.md for detailed information
     VALID_RANGES = {
         # Voltage ranges - CS1016 only supports up to 200V (1000V and 750V are NOT supported)
-        "VOLT:DC": ["200 mV", "2 V", "20 V", "200 V", "AUTO"],
-        "VOLT:AC": ["200 mV", "2 V", "20 V", "AUTO"],
+        "VOLT:DC": ("200 mV", "2 V", "20 V", "200 V", "AUTO"),
+        "VOLT:AC": ("200 mV", "2 V", "20 V", "AUTO"),
         # Current ranges - CS1016 ONLY supports 2A range (all other ranges are NOT supported)
-        "CURR:DC": ["2 A"],  # Only 2A is supported by CS1016
-        "CURR:AC": ["2 A"],  # Only 2A is supported by CS1016
+        "CURR:DC": ("2 A",),  # Only 2A is supported by CS1016
+        "CURR:AC": ("2 A",),  # Only 2A is supported by CS1016
         # Resistance ranges - All ranges supported
-        "RES": ["200 Ohm", "2 kOhm", "20 kOhm", "200 kOhm", "2 MOhm", "10 MOhm", "100 MOhm", "AUTO"],
-        "FRES": ["200 Ohm", "2 kOhm", "20 kOhm", "200 kOhm", "2 MOhm", "10 MOhm", "100 MOhm", "AUTO"],
+        "RES": ("200 Ohm", "2 kOhm", "20 kOhm", "200 kOhm", "2 MOhm", "10 MOhm", "100 MOhm", "AUTO"),
+        "FRES": ("200 Ohm", "2 kOhm", "20 kOhm", "200 kOhm", "2 MOhm", "10 MOhm", "100 MOhm", "AUTO"),
         # Capacitance ranges - 2mF, 20mF, 100mF are NOT supported on SDM4055A (only SDM3065X)
         # Use 10000 uF as alternative to 10 mF
-        "CAP": ["2 nF", "20 nF", "200 nF", "2 uF", "20 uF", "10000 uF", "AUTO"],
+        "CAP": ("2 nF", "20 nF", "200 nF", "2 uF", "20 uF", "10000 uF", "AUTO"),
     }
+    # Same ranges as frozensets for O(1) membership checks
+    VALID_RANGES_SET = {mt: frozenset(ranges) for mt, ranges in VALID_RANGES.items()}
+    _AUTO_ONLY = frozenset({"AUTO"})
+
+    # Measurement type combo items (label, SCPI measurement type)
+    _CURRENT_MEAS_ITEMS = (
+        ("DC Current", "CURR:DC"),
+        ("AC Current", "CURR:AC"),
+    )
+    _FULL_MEAS_ITEMS = (
+        ("DC Voltage", "VOLT:DC"),
+        ("AC Voltage", "VOLT:AC"),
+        ("2-Wire Resistance", "RES"),
+        ("4-Wire Resistance", "FRES"),
+        ("Capacitance", "CAP"),
+        ("Frequency", "FREQ"),
+        ("Diode", "DIOD"),
+        ("Continuity", "CONT"),
+        ("RTD Temperature", "TEMP:RTD"),
+        ("Thermocouple", "TEMP:THER"),
+    )
+    _CURRENT_MEAS_INDEX = {data: index for index, (_, data) in enumerate(_CURRENT_MEAS_ITEMS)}
+    _FULL_MEAS_INDEX = {data: index for index, (_, data) in enumerate(_FULL_MEAS_ITEMS)}
+    # Card grid row of the on-demand thresholds label (between value and selectors)
+    _THRESHOLDS_ROW = 2
+    # Shared measurement combo models, keyed by "is current channel" (created on first use)
+    _MEAS_MODELS = {}
+    # Channels wired to the current inputs (all others measure voltage/resistance/etc.)
+    _CURRENT_CHANNELS: Final[frozenset] = frozenset(range(13, 17))
 
     def __init__(self, channel_num: int, parent=None):
         """
@@ -262,8 +600,11 @@ class ChannelIndicator(QWidget):
 
         self._channel_num = channel_num
         self._value = 0.0
-        self._is_current_channel = channel_num > 12
+        self._is_current_channel = channel_num in self._CURRENT_CHANNELS
         self._range_value = "AUTO"  # Default range
+        # Cached from the range combo on every range change (read on each set_value)
+        self._is_auto_range = True
+        self._conversion_factor = 1.0
         self._current_theme = "dark"  # Default theme
         
         # Set default unit based on channel type
@@ -271,247 +612,191 @@ class ChannelIndicator(QWidget):
             self._unit = "A"  # Current channels (13-16)
         else:
             self._unit = "V"  # Voltage/resistance channels (1-12)
+        # Value format template for the current unit and decimal places (kept in sync with _unit)
+        self._decimals = 6
+        self._value_fmt = _value_format(self._unit, self._decimals)
         
         # Threshold configuration
         self._lower_threshold = None
         self._upper_threshold = None
         self._thresholds_enabled = False
+        
+        # Color state currently shown by the value label (skips redundant re-polish)
+        self._value_state = ""
+        # Rounded display value behind _shown_text
+        self._shown_value = None
+        self._shown_text = None
 
         # Setup UI
         self._setup_ui()
 
+    @classmethod
+    def _ensure_fonts(cls) -> None:
+        """Create the shared fonts on first instantiation."""
+        if cls._CHANNEL_FONT is not None:
+            return
+        cls._CHANNEL_FONT = _shared_font(14, bold=True)
+        cls._VALUE_FONT = _shared_font(cls.VALUE_FONT_SIZE, bold=True, monospace=True)
+        cls._THRESH_FONT = _shared_font(9, italic=True)
+
+    @classmethod
+    def _measurement_model(cls, is_current_channel: bool) -> QStandardItemModel:
+        """
+        Get the shared measurement type item model, building it on first use.
+
+        Args:
+            is_current_channel: True for current channels (13-16).
+
+        Returns:
+            Item model with one row per measurement type (label, UserRole data).
+        """
+        model = cls._MEAS_MODELS.get(is_current_channel)
+        if model is None:
+            model = QStandardItemModel()
+            items = cls._CURRENT_MEAS_ITEMS if is_current_channel else cls._FULL_MEAS_ITEMS
+            for label, data in items:
+                item = QStandardItem(label)
+                item.setData(data, Qt.ItemDataRole.UserRole)
+                model.appendRow(item)
+            cls._MEAS_MODELS[is_current_channel] = model
+        return model
+
     def _setup_ui(self) -> None:
         """Setup widget's UI components."""
-        layout = QVBoxLayout(self)
+        self._ensure_fonts()
+        # One grid for the whole card (no nested row layout): labels span both columns,
+        # the two selectors share the bottom row
+        layout = QGridLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         layout.setSpacing(8)
+        layout.setColumnStretch(0, 1)
+        layout.setColumnStretch(1, 1)
 
         # Channel number label
-        self.channel_label = QLabel(f"CH {self._channel_num}")
-        self.channel_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        channel_font = QFont()
-        channel_font.setPointSize(14)
-        channel_font.setBold(True)
-        self.channel_label.setFont(channel_font)
-        layout.addWidget(self.channel_label)
-
-        # Value label (large, readable with inline unit)
-        self.value_label = QLabel("0.0000 V")
-        self.value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        value_font = QFont()
-        value_font.setPointSize(self.VALUE_FONT_SIZE)
-        value_font.setBold(True)
-        value_font.setFamily("Consolas, Courier New, monospace")
-        self.value_label.setFont(value_font)
-        # Apply font via stylesheet to override theme defaults
-        self.value_label.setStyleSheet(f"""
-            QLabel {{
-                font-size: {self.VALUE_FONT_SIZE}pt;
-                font-weight: bold;
-                font-family: 'Consolas', 'Courier New', monospace;
-            }}
-        """)
-        layout.addWidget(self.value_label)
-        
-        # Thresholds label (displayed when thresholds are configured)
-        self.thresholds_label = QLabel("")
-        self.thresholds_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        thresholds_font = QFont()
-        thresholds_font.setPointSize(9)
-        thresholds_font.setItalic(True)
-        self.thresholds_label.setFont(thresholds_font)
-        self.thresholds_label.setStyleSheet("color: #888;")
-        layout.addWidget(self.thresholds_label)
-
-        # Measurement type and range selector in horizontal layout
-        controls_layout = QHBoxLayout()
-        controls_layout.setSpacing(8)
+        self.channel_label = _CardLabel(f"CH {self._channel_num}", self._CHANNEL_FONT, Qt.AlignmentFlag.AlignLeft)
+        layout.addWidget(self.channel_label, 0, 0, 1, 2)
+
+        # Value label (large, readable with inline unit; plain text skips rich-text detection)
+        self.value_label = _CardLabel("0.0000 V", self._VALUE_FONT, Qt.AlignmentFlag.AlignCenter)
+        # Font and state colors come from the card stylesheet (see apply_card_styles)
+        self.value_label.setObjectName("value")
+        layout.addWidget(self.value_label, 1, 0, 1, 2)
         
+        # Thresholds label (created on demand in _THRESHOLDS_ROW when thresholds are configured)
+        self.thresholds_label = None
+
         # Measurement type selector
-        if self._is_current_channel:
-            # Current channels (13-16): only AC/DC selection
-            self.measurement_combo = QComboBox()
-            self.measurement_combo.addItem("DC Current", "CURR:DC")
-            self.measurement_combo.addItem("AC Current", "CURR:AC")
-            self.measurement_combo.currentIndexChanged.connect(self._on_measurement_type_changed)
-            controls_layout.addWidget(self.measurement_combo, stretch=1)
-        else:
-            # Voltage/resistance/capacitance channels (1-12): full selection
-            self.measurement_combo = QComboBox()
-            self.measurement_combo.addItem("DC Voltage", "VOLT:DC")
-            self.measurement_combo.addItem("AC Voltage", "VOLT:AC")
-            self.measurement_combo.addItem("2-Wire Resistance", "RES")
-            self.measurement_combo.addItem("4-Wire Resistance", "FRES")
-            self.measurement_combo.addItem("Capacitance", "CAP")
-            self.measurement_combo.addItem("Frequency", "FREQ")
-            self.measurement_combo.addItem("Diode", "DIOD")
-            self.measurement_combo.addItem("Continuity", "CONT")
-            self.measurement_combo.addItem("RTD Temperature", "TEMP:RTD")
-            self.measurement_combo.addItem("Thermocouple", "TEMP:THER")
-            self.measurement_combo.currentIndexChanged.connect(self._on_measurement_type_changed)
-            controls_layout.addWidget(self.measurement_combo, stretch=1)
+        # Current channels (13-16): only AC/DC selection
+        # Voltage/resistance/capacitance channels (1-12): full selection
+        self.measurement_combo = (self._build_curr_combo if self._is_current_channel else self._build_volt_combo)()
+        self._measurement_type = self._meas_items[0][1]
+        self.measurement_combo.currentIndexChanged.connect(self._on_measurement_type_changed)
+        layout.addWidget(self.measurement_combo, 3, 0)
         
         # Range selector
-        self.range_combo = QComboBox()
+        self.range_combo = self._new_combo()
         self.range_combo.addItem("AUTO", "AUTO")
+        self._range_values = ("AUTO",)
+        self._range_index = {"AUTO": 0}
         self.range_combo.currentIndexChanged.connect(self._on_range_changed)
-        controls_layout.addWidget(self.range_combo, stretch=1)
-        
-        # Add controls layout to main layout
-        layout.addLayout(controls_layout)
-
-        # Apply card style
-        self._apply_card_style()
-
-    def _apply_card_style(self) -> None:
-        """Apply card-style appearance with shadow effects."""
-        self.setStyleSheet("""
-            ChannelIndicator {
-                background-color: #2d2d2d;
-                border-radius: 10px;
-                border: 1px solid #3d3d3d;
-            }
-            QComboBox {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                border: 1px solid #4d4d4d;
-                border-radius: 4px;
-                padding: 5px;
-                min-height: 25px;
-            }
-            QComboBox:hover {
-                background-color: #4d4d4d;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #ffffff;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #3d3d3d;
-                color: #ffffff;
-                selection-background-color: #4a9eff;
-                border: 1px solid #4d4d4d;
-            }
-        """)
+        layout.addWidget(self.range_combo, 3, 1)
+
+    @staticmethod
+    def _new_combo() -> QComboBox:
+        """
+        Create a selector combo whose popup list skips per-item size computation.
+
+        Returns:
+            Empty combo box.
+        """
+        combo = QComboBox()
+        # All items are single-line text of the same height
+        combo.view().setUniformItemSizes(True)
+        return combo
+
+    def _build_volt_combo(self) -> QComboBox:
+        """
+        Build the measurement type selector for voltage/resistance/capacitance channels.
+
+        Returns:
+            Combo box using the shared full measurement model.
+        """
+        combo = self._new_combo()
+        combo.setModel(self._measurement_model(False))
+        combo.setCurrentIndex(0)
+        # Index -> item and data -> index maps, so the combo's data is never read back from Qt
+        self._meas_items = self._FULL_MEAS_ITEMS
+        self._meas_index = self._FULL_MEAS_INDEX
+        return combo
+
+    def _build_curr_combo(self) -> QComboBox:
+        """
+        Build the measurement type selector for current channels.
+
+        Returns:
+            Combo box using the shared current measurement model.
+        """
+        combo = self._new_combo()
+        combo.setModel(self._measurement_model(True))
+        combo.setCurrentIndex(0)
+        self._meas_items = self._CURRENT_MEAS_ITEMS
+        self._meas_index = self._CURRENT_MEAS_INDEX
+        return combo
 
     def update_theme(self, theme: str) -> None:
         """
         Update widget theme.
 
+        The card and its labels are restyled through apply_card_styles() on its parent.
+
         Args:
             theme: Theme string ("dark" or "light").
         """
         self._current_theme = theme
-        if theme == "dark":
-            self.setStyleSheet("""
-                ChannelIndicator {
-                    background-color: #2d2d2d;
-                    border-radius: 10px;
-                    border: 1px solid #3d3d3d;
-                }
-                QComboBox {
-                    background-color: #3d3d3d;
-                    color: #ffffff;
-                    border: 1px solid #4d4d4d;
-                    border-radius: 4px;
-                    padding: 5px;
-                    min-height: 25px;
-                }
-                QComboBox:hover {
-                    background-color: #4d4d4d;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border-left: 5px solid transparent;
-                    border-right: 5px solid transparent;
-                    border-top: 5px solid #ffffff;
-                    margin-right: 5px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #3d3d3d;
-                    color: #ffffff;
-                    selection-background-color: #4a9eff;
-                    border: 1px solid #4d4d4d;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                ChannelIndicator {
-                    background-color: #f5f5f5;
-                    border-radius: 10px;
-                    border: 1px solid #d0d0d0;
-                }
-                QComboBox {
-                    background-color: #ffffff;
-                    color: #000000;
-                    border: 1px solid #b0b0b0;
-                    border-radius: 4px;
-                    padding: 5px;
-                    min-height: 25px;
-                }
-                QComboBox:hover {
-                    background-color: #f0f0f0;
-                }
-                QComboBox::drop-down {
-                    border: none;
-                }
-                QComboBox::down-arrow {
-                    image: none;
-                    border-left: 5px solid transparent;
-                    border-right: 5px solid transparent;
-                    border-top: 5px solid #000000;
-                    margin-right: 5px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #ffffff;
-                    color: #000000;
-                    selection-background-color: #4a9eff;
-                    border: 1px solid #b0b0b0;
-                }
-            """)
-        # Re-apply threshold colors if thresholds are enabled
-        if self._thresholds_enabled:
-            self._apply_threshold_color(self._value)
 
     def set_value(self, value: float, unit: str = None) -> None:
         """
         Update the displayed value with range-based conversion and threshold color coding.
+        
+        Readings that round to the value already shown (at the display precision)
+        are stored without a repaint.
 
         Args:
             value: New measurement value (from device).
             unit: Unit string to display (optional, uses current unit if not provided).
         """
         self._value = value
-        if unit is not None:
+        if unit is not None and unit != self._unit:
             self._unit = unit
+            self._value_fmt = _value_format(unit, self._decimals)
+        elif (self.value_label.last_text is self._shown_text
+                and round(self._display_value(), self._decimals) == self._shown_value):
+            # Label still shows this reading
+            return
+        
+        display_value = self._display_value()
+        self.value_label.setText(self._value_fmt % display_value)
+        self._shown_value = round(display_value, self._decimals)
+        self._shown_text = self.value_label.last_text
         
-        # Apply range-based value conversion
-        range_value = self.range_combo.currentData()
-        if range_value and range_value != "AUTO":
-            # For fixed ranges, apply conversion factor
-            conversion_factor = self.RANGE_TO_CONVERSION.get(range_value, 1)
-            converted_value = value * conversion_factor
-            self.value_label.setText(f"{converted_value:.6f} {self._unit}")
+        # Apply threshold-based color coding if enabled, otherwise clear any status color
+        if self._thresholds_enabled:
+            self._apply_threshold_color(display_value, use_converted=not self._is_auto_range)
         else:
+            self._set_value_state("")
+
+    def _display_value(self) -> float:
+        """Return the current value converted for the selected range."""
+        if self._is_auto_range:
             # For AUTO range, use the unit from device response
             # The device returns the value in the unit it selected (e.g., mV, V, etc.)
-            self.value_label.setText(f"{value:.6f} {self._unit}")
-        
-        # Apply threshold-based color coding if enabled
-        if self._thresholds_enabled:
-            if range_value and range_value != "AUTO":
-                self._apply_threshold_color(converted_value, use_converted=True)
-            else:
-                self._apply_threshold_color(value, use_converted=False)
+            return self._value
+        # For fixed ranges, apply conversion factor
+        return self._value * self._conversion_factor
+
+    def _refresh_text(self) -> None:
+        """Update the value label text only (no threshold re-coloring)."""
+        self.value_label.setText(self._value_fmt % self._display_value())
 
     def set_unit(self, unit: str) -> None:
         """
@@ -520,8 +805,21 @@ class ChannelIndicator(QWidget):
             unit: Unit string to display.
         """
         self._unit = unit
-        # Refresh value display with new unit
-        self.set_value(self._value)
+        self._value_fmt = _value_format(unit, self._decimals)
+        # Refresh value text with new unit (colors are handled by the caller's value update)
+        self._refresh_text()
+
+    def set_display_precision(self, decimals: int) -> None:
+        """
+        Set the number of decimal places shown (and used to skip unchanged readings).
+
+        Args:
+            decimals: Decimal places, 6 by default.
+        """
+        self._decimals = decimals
+        self._value_fmt = _value_format(self._unit, decimals)
+        self._shown_value = None
+        self._refresh_text()
 
     def set_status(self, status: str, error: bool = False) -> None:
         """
@@ -531,20 +829,16 @@ class ChannelIndicator(QWidget):
             status: Status text to display.
             error: If True, display status in red color.
         """
-        self.status_label.setText(status)
+        self.value_label.setText(status)
         if error:
-            self.status_label.setStyleSheet("color: #ff6b6b;")
+            self._set_value_state("error")
         else:
-            self.status_label.setStyleSheet("color: #51cf66;")
+            self._set_value_state("ok")
 
     def reset_status(self) -> None:
         """Reset the value label to normal display."""
-        self.value_label.setText(f"{self._value:.6f} {self._unit}")
-        self.value_label.setStyleSheet(f"""
-            font-size: {self.VALUE_FONT_SIZE}pt;
-                font-weight: bold;
-                font-family: 'Consolas', 'Courier New', monospace;
-            """)
+        self.value_label.setText(self._value_fmt % self._value)
+        self._set_value_state("")
 
     def set_thresholds(self, lower: Optional[float] = None, upper: Optional[float] = None) -> None:
         """
@@ -570,15 +864,25 @@ class ChannelIndicator(QWidget):
         self._lower_threshold = None
         self._upper_threshold = None
         self._thresholds_enabled = False
-        self.value_label.setStyleSheet("")
+        self._set_value_state("")
         self._update_thresholds_display()
 
     def _update_thresholds_display(self) -> None:
         """Update thresholds label based on current threshold values."""
         if not self._thresholds_enabled:
-            self.thresholds_label.setText("")
+            # Drop the label entirely so unused channels don't carry an extra widget
+            if self.thresholds_label is not None:
+                self.layout().removeWidget(self.thresholds_label)
+                self.thresholds_label.deleteLater()
+                self.thresholds_label = None
             return
         
+        if self.thresholds_label is None:
+            self.thresholds_label = _CardLabel("", self._THRESH_FONT, Qt.AlignmentFlag.AlignCenter)
+            self.thresholds_label.setObjectName("thresholds")
+            # Place it directly below the value label
+            self.layout().addWidget(self.thresholds_label, self._THRESHOLDS_ROW, 0, 1, 2)
+        
         # Build threshold display text
         parts = []
         if self._lower_threshold is not None:
@@ -611,30 +915,23 @@ class ChannelIndicator(QWidget):
         if self._upper_threshold is not None and value > self._upper_threshold:
             in_range = False
 
-        # Apply color while preserving font style (theme-aware)
-        if self._current_theme == "dark":
-            # Dark theme colors
-            green_color = "#51cf66"  # Bright green
-            red_color = "#ff6b6b"    # Bright red
-        else:
-            # Light theme colors (darker for better contrast)
-            green_color = "#2e7d32"  # Darker green
-            red_color = "#c62828"    # Darker red
-
-        if in_range:
-            self.value_label.setStyleSheet(f"""
-                color: {green_color};
-                font-size: {self.VALUE_FONT_SIZE}pt;
-                font-weight: bold;
-                font-family: 'Consolas', 'Courier New', monospace;
-            """)  # Green
-        else:
-            self.value_label.setStyleSheet(f"""
-                color: {red_color};
-                font-size: {self.VALUE_FONT_SIZE}pt;
-                font-weight: bold;
-                font-family: 'Consolas', 'Courier New', monospace;
-            """)  # Red
+        # Apply color (theme-aware colors come from the value label stylesheet)
+        self._set_value_state("in_range" if in_range else "out_of_range")
+
+    def _set_value_state(self, state: str) -> None:
+        """
+        Switch the value label color state, skipping the re-polish if it is unchanged.
+
+        Args:
+            state: One of "", "ok", "error", "in_range", "out_of_range".
+        """
+        if state == self._value_state:
+            return
+        self._value_state = state
+        self.value_label.setProperty("state", state)
+        style = self.value_label.style()
+        style.unpolish(self.value_label)
+        style.polish(self.value_label)
 
     def get_value(self) -> float:
         """Get current displayed value."""
@@ -647,7 +944,7 @@ class ChannelIndicator(QWidget):
         Returns:
             Measurement type string (e.g., "VOLT:DC").
         """
-        return self.measurement_combo.currentData()
+        return self._measurement_type
 
     def get_range(self) -> str:
         """
@@ -656,64 +953,96 @@ class ChannelIndicator(QWidget):
         Returns:
             Range value string (e.g., "200 mV", "AUTO").
         """
-        return self.range_combo.currentData()
+        return self._range_value
 
-    def set_range(self, range_value: str) -> None:
+    def set_range(self, range_value: str, emit: bool = False) -> Optional[str]:
         """
         Set measurement range.
         
+        Like set_measurement_type, a programmatic change does not emit range_changed
+        unless requested. Ranges not offered for the current measurement type are
+        ignored.
+
         Args:
             range_value: Range value string (e.g., "200 mV", "AUTO").
+            emit: If True, emit range_changed afterwards.
+
+        Returns:
+            The range in effect afterwards, for callers that mirror it.
         """
-        index = self.range_combo.findData(range_value)
+        index = self._range_index.get(range_value, -1)
         if index >= 0:
-            self.range_combo.setCurrentIndex(index)
-            # Update unit label based on new range and measurement type
-            measurement_type = self.measurement_combo.currentData()
-            self._update_unit_for_measurement_type(measurement_type)
+            with QSignalBlocker(self.range_combo):
+                self.range_combo.setCurrentIndex(index)
+            self._apply_range(index)
+            if emit:
+                self.range_changed.emit(self._channel_num, self._range_value)
+        return self._range_value
 
-    def set_measurement_type(self, measurement_type: str) -> None:
+    def set_measurement_type(self, measurement_type: str, emit: bool = False) -> Optional[str]:
         """
         Set the measurement type.
         
+        The combo's change handler is bypassed, so a programmatic change does not
+        emit measurement_type_changed unless requested. The range falls back to
+        AUTO (or the first valid range) if the current one is not valid for the
+        new type; without emit, callers must pick that up from the return value.
+
         Args:
             measurement_type: Measurement type string (e.g., "VOLT:DC").
+            emit: If True, emit measurement_type_changed afterwards.
+
+        Returns:
+            The range in effect afterwards.
         """
-        index = self.measurement_combo.findData(measurement_type)
+        index = self._meas_index.get(measurement_type, -1)
         if index >= 0:
-            self.measurement_combo.setCurrentIndex(index)
+            with QSignalBlocker(self.measurement_combo):
+                self.measurement_combo.setCurrentIndex(index)
+            measurement_type = self._measurement_type = self._meas_items[index][1]
             # Update unit label based on measurement type
             self._update_unit_for_measurement_type(measurement_type)
             # Update range dropdown options for this measurement type
-            self._update_range_options(measurement_type)
-        self.measurement_type_changed.emit(self._channel_num, measurement_type)
+            self._update_range_options(measurement_type, emit=emit)
+        if emit:
+            self.measurement_type_changed.emit(self._channel_num, measurement_type)
+        return self._range_value
 
-    def _update_range_options(self, measurement_type: str) -> None:
+    def _update_range_options(self, measurement_type: str, emit: bool = True) -> None:
         """
         Update range dropdown options based on the selected measurement type.
         
         Args:
             measurement_type: Measurement type string.
+            emit: If True, emit range_changed when the selected range had to change.
         """
         # Save current range value if it's still valid
-        current_range = self.range_combo.currentData()
+        current_range = self._range_value
         
-        # Clear and repopulate range dropdown
-        self.range_combo.clear()
-        valid_ranges = self.VALID_RANGES.get(measurement_type, ["AUTO"])
-        for range_val in valid_ranges:
-            self.range_combo.addItem(range_val, range_val)
+        # Repopulate with signals blocked so clear()/addItem() don't fire intermediate range changes
+        with QSignalBlocker(self.range_combo):
+            # Clear and repopulate range dropdown
+            self.range_combo.clear()
+            valid_ranges = self.VALID_RANGES.get(measurement_type, ("AUTO",))
+            self.range_combo.addItems(valid_ranges)
+            for index, range_val in enumerate(valid_ranges):
+                self.range_combo.setItemData(index, range_val)
+            self._range_values = valid_ranges
+            self._range_index = {range_val: index for index, range_val in enumerate(valid_ranges)}
+            
+            # Try to restore previous range value if it's still valid, otherwise default to AUTO
+            # (the first item is current after repopulating if neither is available)
+            if current_range in self.VALID_RANGES_SET.get(measurement_type, self._AUTO_ONLY):
+                index = self._range_index.get(current_range, 0)
+            else:
+                index = self._range_index.get("AUTO", 0)
+            self.range_combo.setCurrentIndex(index)
         
-        # Try to restore previous range value if it's still valid
-        if current_range in valid_ranges:
-            index = self.range_combo.findData(current_range)
-            if index >= 0:
-                self.range_combo.setCurrentIndex(index)
-        else:
-            # Default to AUTO
-            index = self.range_combo.findData("AUTO")
-            if index >= 0:
-                self.range_combo.setCurrentIndex(index)
+        # Handle the range change once, only if the effective range actually changed
+        if valid_ranges[index] != current_range:
+            self._apply_range(index)
+            if emit:
+                self.range_changed.emit(self._channel_num, self._range_value)
 
     def _update_unit_for_measurement_type(self, measurement_type: str) -> None:
         """
@@ -722,33 +1051,58 @@ class ChannelIndicator(QWidget):
         Args:
             measurement_type: Measurement type string.
         """
-        # Get unit based on current range
-        range_value = self.range_combo.currentData()
-        if range_value and range_value != "AUTO":
-            unit = self.RANGE_TO_UNIT.get(range_value, self.MEASUREMENT_TYPE_TO_UNIT.get(measurement_type, "V"))
+        # Fixed ranges set the unit; AUTO uses the measurement type's unit
+        info = self._RANGE_INFO.get(self._range_value)
+        if info is not None:
+            self.set_unit(info[0])
         else:
-            unit = self.MEASUREMENT_TYPE_TO_UNIT.get(measurement_type, "V")
-        self.set_unit(unit)
+            self.set_unit(self.MEASUREMENT_TYPE_TO_UNIT.get(measurement_type, "V"))
 
+    @Slot(int)
     def _on_measurement_type_changed(self, index: int) -> None:
         """Handle measurement type combo box change."""
-        measurement_type = self.measurement_combo.currentData()
+        # Item data comes from the class tables (interned literals), not a QVariant round-trip
+        measurement_type = self._meas_items[index][1] if index >= 0 else None
+        self._measurement_type = measurement_type
         # Update unit label based on new measurement type
         self._update_unit_for_measurement_type(measurement_type)
         # Update range dropdown options for this measurement type
         self._update_range_options(measurement_type)
         self.measurement_type_changed.emit(self._channel_num, measurement_type)
 
+    @Slot(int)
     def _on_range_changed(self, index: int) -> None:
         """Handle range combo box change."""
-        range_value = self.range_combo.currentData()
-        measurement_type = self.measurement_combo.currentData()
+        self._apply_range(index)
+        # Emit signal for range change
+        self.range_changed.emit(self._channel_num, self._range_value)
+
+    def _apply_range(self, index: int) -> None:
+        """
+        Take over the range selected in the combo: cache its state, update unit and colors.
+
+        Args:
+            index: Current range combo index.
+        """
+        range_value = self._range_values[index] if index >= 0 else None
+        measurement_type = self._measurement_type
+        
+        # Cache range state so set_value doesn't query the combo on every update
+        self._range_value = range_value
+        info = self._RANGE_INFO.get(range_value)
+        self._is_auto_range = info is None
         
         # Update unit label based on new range and measurement type
-        self._update_unit_for_measurement_type(measurement_type)
+        if info is None:
+            self._conversion_factor = 1
+            self.set_unit(self.MEASUREMENT_TYPE_TO_UNIT.get(measurement_type, "V"))
+        else:
+            unit, self._conversion_factor = info
+            self.set_unit(unit)
         
-        # Emit signal for range change
-        self.range_changed.emit(self._channel_num, range_value)
+        # Conversion factor changed, so re-check thresholds against the converted value
+        if self._thresholds_enabled:
+            self._apply_threshold_color(self._display_value(), use_converted=not self._is_auto_range)
 
 
 class QLogHandler(QObject, logging.Handler):
@@ -951,6 +1305,7 @@ class LogViewerWidget(QWidget):
         self.text_logs.verticalScrollBar().valueChanged.connect(self._on_scroll_changed)
         layout.addWidget(self.text_logs)
 
+    @Slot(int)
     def _on_scroll_changed(self, value: int) -> None:
         """
         Handle scroll bar value change to detect manual scrolling.
@@ -968,6 +1323,7 @@ class LogViewerWidget(QWidget):
             self._auto_scroll = True
             self.chk_auto_scroll.setChecked(True)
 
+    @Slot(bool)
     def _set_auto_scroll(self, enabled: bool) -> None:
         """
         Set auto-scroll state.
@@ -1065,7 +1421,7 @@ class LogViewerWidget(QWidget):
 
         # Set color using QTextCharFormat (more efficient than HTML)
         char_format = cursor.charFormat()
-        char_format.setForeground(QColor(color))
+        char_format.setForeground(_shared_color(color))
         cursor.setCharFormat(char_format)
 
         # Insert text
@@ -1079,6 +1435,7 @@ class LogViewerWidget(QWidget):
         scrollbar = self.text_logs.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    @Slot()
     def _clear_logs(self) -> None:
         """Clear all logs from the viewer."""
         self._log_buffer.clear()
@@ -1369,6 +1726,7 @@ class ChannelProgressIndicator(QWidget):
             self._animation_timer.start(100)  # Update every 100ms
             self._animation_step = 0
 
+    @Slot()
     def _animate_spinner(self) -> None:
         """Animate the spinner icon."""
         if not self._is_scanning:
@@ -6,7 +6,7 @@ import logging
 import os
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Final, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Signal, Slot, Qt
 from PySide6.QtGui import QAction, QMouseEvent, QIcon, QPainter, QPainterPath, QColor, QFontMetrics
@@ -32,14 +32,68 @@ from PySide6.QtWidgets import (
 from PySide6.QtWidgets import QStyle
 
 from hardware.visa_interface import VisaInterface, MeasurementType, ScanDataResult
-from hardware.async_worker import AsyncScanManager
+from hardware.async_worker import AsyncScanManager, AsyncConnectManager
 from hardware.simulator import VisaSimulator
-from gui.widgets import ChannelIndicator, LogViewerDialog, QLogHandler, ChannelProgressIndicator
+from gui.widgets import (
+    ChannelIndicator, LogViewerDialog, QLogHandler, ChannelProgressIndicator,
+    CHANNEL_COMBO_QSS_DARK, CHANNEL_COMBO_QSS_LIGHT, batched_updates, apply_card_styles
+)
 from gui.theme_manager import ThemeManager
 from config import ConfigLoader, ChannelThresholdConfig
 
 logger = logging.getLogger(__name__)
 
+# Label and input colors for success/error states
+_STATUS_OK_QSS: Final[str] = "color: #51cf66; font-weight: bold;"
+_STATUS_ERROR_QSS: Final[str] = "color: #ff6b6b; font-weight: bold;"
+# Placeholder text for file labels with no file selected
+_FILE_HINT_QSS: Final[str] = "color: #888; font-style: italic;"
+# Serial number input colors for a new valid number and an invalid one
+_SERIAL_NEW_QSS: Final[str] = "color: white;"
+_SERIAL_INVALID_QSS: Final[str] = "color: red;"
+
+# Flat icon buttons in the toolbar and status bar, per theme
+_ICON_BUTTON_QSS: Final[Dict[str, str]] = {
+    "dark": """
+        QPushButton {
+            background-color: transparent;
+            border: none;
+            border-radius: 4px;
+        }
+        QPushButton:hover {
+            background-color: #4d4d4d;
+        }
+        QPushButton:pressed {
+            background-color: #5d5d5d;
+        }
+    """,
+    "light": """
+        QPushButton {
+            background-color: transparent;
+            border: none;
+            border-radius: 4px;
+        }
+        QPushButton:hover {
+            background-color: #d0d0d0;
+        }
+        QPushButton:pressed {
+            background-color: #b0b0b0;
+        }
+    """,
+}
+
+
+def _set_style_sheet(widget: QWidget, qss: str) -> None:
+    """
+    Apply a stylesheet unless the widget already has it, avoiding a re-parse and re-polish.
+
+    Args:
+        widget: Widget to style.
+        qss: Stylesheet string.
+    """
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
 
 class ClickToClearLineEdit(QLineEdit):
     """Custom QLineEdit that clears text when clicked."""
@@ -115,6 +169,9 @@ class MainWindow(QMainWindow):
         # Async scan manager
         self.scan_manager: Optional[AsyncScanManager] = None
 
+        # Background connection attempt (kept alive until the next connect)
+        self._connect_manager: Optional[AsyncConnectManager] = None
+
         # Channel indicators (1-16)
         self.channel_indicators: List[ChannelIndicator] = []
 
@@ -187,7 +244,7 @@ class MainWindow(QMainWindow):
         self.device_info_label = QLabel("No device connected")
 
         self.status_label = QLabel("Disconnected")
-        self.status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+        self.status_label.setStyleSheet(_STATUS_ERROR_QSS)
 
         conn_layout.addWidget(self.btn_connect)
         conn_layout.addWidget(self.btn_disconnect)
@@ -250,7 +307,7 @@ class MainWindow(QMainWindow):
         self.btn_load_config = QPushButton("Load Config")
         self.btn_load_config.clicked.connect(self._on_load_config_clicked)
         self.lbl_config_file = QLabel("No config loaded")
-        self.lbl_config_file.setStyleSheet("color: #888; font-style: italic;")
+        self.lbl_config_file.setStyleSheet(_FILE_HINT_QSS)
         self.lbl_config_file.setWordWrap(True)
         
         config_layout.addWidget(self.btn_load_config)
@@ -280,7 +337,7 @@ class MainWindow(QMainWindow):
         
         # Single shared label for report file name
         self.lbl_report_file = QLabel("No report file selected")
-        self.lbl_report_file.setStyleSheet("color: #888; font-style: italic;")
+        self.lbl_report_file.setStyleSheet(_FILE_HINT_QSS)
         self.lbl_report_file.setWordWrap(True)
         report_layout.addWidget(self.lbl_report_file)
         
@@ -294,15 +351,21 @@ class MainWindow(QMainWindow):
         channels_group = QGroupBox("Channel Measurements")
         channels_layout = QGridLayout()
 
+        # Install the layout first and create each indicator directly under the group box,
+        # so the cards are never built as parentless top-level widgets and reparented afterwards
+        channels_group.setLayout(channels_layout)
+
         self.channel_indicators = []
         for i in range(16):
             row = i // 4
             col = i % 4
-            indicator = ChannelIndicator(channel_num=i + 1)
+            indicator = ChannelIndicator(channel_num=i + 1, parent=channels_group)
             channels_layout.addWidget(indicator, row, col)
             self.channel_indicators.append(indicator)
 
-        channels_group.setLayout(channels_layout)
+        # Style all cards with one stylesheet on the group box once the grid is built
+        apply_card_styles(channels_group)
+        self._channels_group = channels_group
         main_layout.addWidget(channels_group)
 
         # Status bar
@@ -322,19 +385,7 @@ class MainWindow(QMainWindow):
         self.btn_log_viewer.setIcon(icon)
         self.btn_log_viewer.setToolTip("Open Log Viewer")
         self.btn_log_viewer.setFixedSize(30, 30)
-        self.btn_log_viewer.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #4d4d4d;
-            }
-            QPushButton:pressed {
-                background-color: #5d5d5d;
-            }
-        """)
+        self.btn_log_viewer.setStyleSheet(_ICON_BUTTON_QSS["dark"])
         self.btn_log_viewer.clicked.connect(self._toggle_log_viewer)
         self.status_bar.addPermanentWidget(self.btn_log_viewer, 0)
 
@@ -408,6 +459,7 @@ class MainWindow(QMainWindow):
         """
         self._current_theme = theme
 
+        # Channel card combo rules are included here so Qt parses them once for all 16 cards
         if theme == "dark":
             # Dark theme styles
             self.setStyleSheet("""
@@ -488,7 +540,7 @@ class MainWindow(QMainWindow):
                 QLineEdit:focus {
                     border: 1px solid #4a9eff;
                 }
-            """)
+            """ + CHANNEL_COMBO_QSS_DARK)
         else:
             # Light theme styles
             self.setStyleSheet("""
@@ -569,7 +621,7 @@ class MainWindow(QMainWindow):
                 QLineEdit:focus {
                     border: 1px solid #4a9eff;
                 }
-            """)
+            """ + CHANNEL_COMBO_QSS_LIGHT)
 
     def _setup_connections(self) -> None:
         """Setup signal connections."""
@@ -594,7 +646,6 @@ class MainWindow(QMainWindow):
     def _on_connect_clicked(self) -> None:
         """Handle connect button click."""
         self.status_updated.emit("Connecting to device...")
-        QApplication.processEvents()
 
         # Get selected device from combo box
         selected_device = self.device_combo.currentData()
@@ -603,65 +654,65 @@ class MainWindow(QMainWindow):
         if selected_device == "SIMULATOR":
             self._using_simulator = True
             logger.info("Using simulator mode")
-
-            # Connect to simulator
-            success = self.simulator.connect()
-
-            if success:
-                # Update device info display
-                device_info = self.simulator.get_device_info()
-                self._update_device_info_display(device_info)
-
-                self.status_label.setText("Connected (Simulator)")
-                self.status_label.setStyleSheet(
-                    "color: #51cf66; font-weight: bold;")
-                self.btn_connect.setEnabled(False)
-                self.btn_disconnect.setEnabled(True)
-                self.btn_start_scan.setEnabled(True)
-                self.btn_single_scan.setEnabled(True)
-                self.connection_changed.emit(True)
-                self.status_updated.emit("Connected to Simulator")
-                logger.info("Successfully connected to simulator")
-            else:
-                self.status_label.setText("Error")
-                self.status_label.setStyleSheet(
-                    "color: #ff6b6b; font-weight: bold;")
-                QMessageBox.critical(
-                    self,
-                    "Connection Error",
-                    "Failed to connect to simulator.",
-                )
-                self.status_updated.emit("Connection failed")
-                logger.error("Failed to connect to simulator")
+            device_interface = self.simulator
         else:
             # Connect to physical device
             self._using_simulator = False
             if selected_device:
                 self.visa.resource_string = selected_device
                 logger.info(f"Using selected device: {selected_device}")
+            device_interface = self.visa
+
+        # Connect in the background so a slow VISA session open doesn't freeze the UI
+        self.btn_connect.setEnabled(False)
+        self.device_combo.setEnabled(False)
+        self._connect_manager = AsyncConnectManager(device_interface)
+        self._connect_manager.connect_finished.connect(self._on_connect_finished)
+        if not self._connect_manager.start():
+            self._on_connect_finished(False, {})
 
-            # Try to connect
-            success = self.visa.connect()
-
-            if success:
-                # Update device info display
-                device_info = self.visa.get_device_info()
-                self._update_device_info_display(device_info)
-
-                self.status_label.setText("Connected")
-                self.status_label.setStyleSheet(
-                    "color: #51cf66; font-weight: bold;")
-                self.btn_connect.setEnabled(False)
-                self.btn_disconnect.setEnabled(True)
-                self.btn_start_scan.setEnabled(True)
-                self.btn_single_scan.setEnabled(True)
-                self.connection_changed.emit(True)
+    @Slot(bool, object)
+    def _on_connect_finished(self, success: bool, device_info) -> None:
+        """Handle the result of a background connection attempt.
+
+        Args:
+            success: True if the device connected.
+            device_info: Device information dictionary (empty on failure).
+        """
+        if success:
+            # Update device info display
+            self._update_device_info_display(device_info)
+
+            self.status_label.setText(
+                "Connected (Simulator)" if self._using_simulator else "Connected")
+            _set_style_sheet(self.status_label, _STATUS_OK_QSS)
+            self.btn_connect.setEnabled(False)
+            self.btn_disconnect.setEnabled(True)
+            self.btn_start_scan.setEnabled(True)
+            self.btn_single_scan.setEnabled(True)
+            self.device_combo.setEnabled(True)
+            self.connection_changed.emit(True)
+            if self._using_simulator:
+                self.status_updated.emit("Connected to Simulator")
+                logger.info("Successfully connected to simulator")
+            else:
                 self.status_updated.emit("Connected to SDM4055A-SC")
                 logger.info("Successfully connected to device")
+        else:
+            self.status_label.setText("Error")
+            _set_style_sheet(self.status_label, _STATUS_ERROR_QSS)
+            self.btn_connect.setEnabled(True)
+            self.device_combo.setEnabled(True)
+            self.status_updated.emit("Connection failed")
+            if self._using_simulator:
+                logger.error("Failed to connect to simulator")
+                QMessageBox.critical(
+                    self,
+                    "Connection Error",
+                    "Failed to connect to simulator.",
+                )
             else:
-                self.status_label.setText("Error")
-                self.status_label.setStyleSheet(
-                    "color: #ff6b6b; font-weight: bold;")
+                logger.error("Failed to connect to device")
                 QMessageBox.critical(
                     self,
                     "Connection Error",
@@ -670,8 +721,6 @@ class MainWindow(QMainWindow):
                     "2. USB cable is connected\n"
                     "3. VISA drivers are installed",
                 )
-                self.status_updated.emit("Connection failed")
-                logger.error("Failed to connect to device")
 
     @Slot()
     def _on_disconnect_clicked(self) -> None:
@@ -690,7 +739,7 @@ class MainWindow(QMainWindow):
 
         # Update UI
         self.status_label.setText("Disconnected")
-        self.status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+        _set_style_sheet(self.status_label, _STATUS_ERROR_QSS)
         self.btn_connect.setEnabled(True)
         self.btn_disconnect.setEnabled(False)
         self.btn_start_scan.setEnabled(False)
@@ -719,7 +768,8 @@ class MainWindow(QMainWindow):
             measurement_type = self._channel_measurement_types[i]
             range_value = self._channel_ranges[i]
             indicator.set_measurement_type(measurement_type)
-            indicator.set_range(range_value)
+            # Record the range the channel actually uses (current channels have no AUTO range)
+            self._channel_ranges[i] = indicator.set_range(range_value)
 
     @Slot(int, str)
     def _on_channel_measurement_type_changed(self, channel_num: int, measurement_type: str) -> None:
@@ -752,9 +802,10 @@ class MainWindow(QMainWindow):
     def _on_connection_changed(self, connected: bool) -> None:
         """Handle connection state change."""
         if not connected:
-            # Reset all channel indicators
-            for indicator in self.channel_indicators:
-                indicator.reset_status()
+            # Reset all channel indicators, repainting each once
+            with batched_updates(self.channel_indicators):
+                for indicator in self.channel_indicators:
+                    indicator.reset_status()
 
     @Slot(str)
     def _on_theme_changed(self, theme: str) -> None:
@@ -770,6 +821,7 @@ class MainWindow(QMainWindow):
         self._apply_theme(theme)
 
         # Update all channel indicators' themes
+        apply_card_styles(self._channels_group, theme)
         for indicator in self.channel_indicators:
             indicator.update_theme(theme)
 
@@ -813,7 +865,6 @@ class MainWindow(QMainWindow):
         # Connect signals
         self.scan_manager.scan_complete.connect(self.scan_complete.emit)
         self.scan_manager.scan_started.connect(self.scan_started.emit)
-        self.scan_manager.channel_read.connect(self._on_channel_read)
         self.scan_manager.scan_stopped.connect(self._on_scan_stopped)
 
         # Start scanning
@@ -887,11 +938,37 @@ class MainWindow(QMainWindow):
         """
         logger.info(f"Scan complete. Measurements: {measurements}")
 
-        # Update all channel indicators with new measurements
-        for channel_num, result in measurements.items():
-            if 1 <= channel_num <= 16:
-                indicator = self.channel_indicators[channel_num - 1]
-                
+        # Update channel indicators from the latest published scan (once per scan)
+        self._drain_measurements()
+
+        # Update progress indicator
+        self.scan_progress.complete_scan()
+        self.status_updated.emit(
+            f"Scan complete - {len(measurements)} channels measured")
+
+    @Slot()
+    def _drain_measurements(self) -> None:
+        """Apply the latest continuous scan results, skipping scans superseded before the GUI caught up."""
+        if self.scan_manager is None:
+            return
+        measurements = self.scan_manager.latest_measurements.consume()
+        if measurements is not None:
+            self._apply_measurements(measurements)
+
+    def _apply_measurements(self, measurements) -> None:
+        """Update the channel indicators with one scan's measurements.
+
+        Args:
+            measurements: Dictionary mapping channel numbers to ScanDataResult objects (or None)
+        """
+        indicators = self.channel_indicators
+        # Repaint each indicator once after the whole scan is applied
+        with batched_updates(indicators):
+            for channel_num, result in measurements.items():
+                if not 1 <= channel_num <= 16:
+                    continue
+                indicator = indicators[channel_num - 1]
+
                 if result is None:
                     # No data available for this channel
                     indicator.set_status("No data", error=True)
@@ -902,11 +979,6 @@ class MainWindow(QMainWindow):
                     # Valid measurement - update with value and unit
                     indicator.set_value(result.value, result.unit)
 
-        # Update progress indicator
-        self.scan_progress.complete_scan()
-        self.status_updated.emit(
-            f"Scan complete - {len(measurements)} channels measured")
-
     @Slot()
     def _on_scan_stopped(self) -> None:
         """Handle scan stopped signal."""
@@ -962,19 +1034,7 @@ class MainWindow(QMainWindow):
         logger.info(f"Serial number validated: {serial_number}")
 
         # Update all channel indicators with new measurements
-        for channel_num, result in measurements.items():
-            if 1 <= channel_num <= 16:
-                indicator = self.channel_indicators[channel_num - 1]
-
-                if result is None:
-                    # No data available for this channel
-                    indicator.set_status("No data", error=True)
-                elif result.unit == "OVERLOAD":
-                    # Overload condition detected
-                    indicator.set_status(result.full_unit, error=True)
-                else:
-                    # Valid measurement - update with value and unit
-                    indicator.set_value(result.value, result.unit)
+        self._apply_measurements(measurements)
 
         # Write to report file
         logger.info("Writing measurements to report file...")
@@ -983,10 +1043,10 @@ class MainWindow(QMainWindow):
         # Check if serial number exists in report and update color
         logger.info("Checking serial number in report after write...")
         if self._check_serial_in_report(serial_number):
-            self.serial_number_input.setStyleSheet("color: #51cf66; font-weight: bold;")
+            _set_style_sheet(self.serial_number_input, _STATUS_OK_QSS)
             logger.info(f"Serial number '{serial_number}' confirmed in report, set green color")
         else:
-            self.serial_number_input.setStyleSheet("color: white;")
+            _set_style_sheet(self.serial_number_input, _SERIAL_NEW_QSS)
             logger.info(f"Serial number '{serial_number}' not found in report, set white color")
 
         # Update progress indicator
@@ -1080,64 +1140,14 @@ class MainWindow(QMainWindow):
         if current_theme == "dark":
             # Dark theme - tooltip indicates switching to light
             self.btn_theme_toggle.setToolTip("Switch to Light Theme")
-            self.btn_theme_toggle.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #4d4d4d;
-                }
-                QPushButton:pressed {
-                    background-color: #5d5d5d;
-                }
-            """)
+            button_qss = _ICON_BUTTON_QSS["dark"]
         else:
             # Light theme - tooltip indicates switching to dark
             self.btn_theme_toggle.setToolTip("Switch to Dark Theme")
-            self.btn_theme_toggle.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #d0d0d0;
-                }
-                QPushButton:pressed {
-                    background-color: #b0b0b0;
-                }
-            """)
+            button_qss = _ICON_BUTTON_QSS["light"]
+        _set_style_sheet(self.btn_theme_toggle, button_qss)
         # Update log viewer button style
-        if current_theme == "dark":
-            self.btn_log_viewer.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #4d4d4d;
-                }
-                QPushButton:pressed {
-                    background-color: #5d5d5d;
-                }
-            """)
-        else:
-            self.btn_log_viewer.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    border: none;
-                    border-radius: 4px;
-                }
-                QPushButton:hover {
-                    background-color: #d0d0d0;
-                }
-                QPushButton:pressed {
-                    background-color: #b0b0b0;
-                }
-            """)
+        _set_style_sheet(self.btn_log_viewer, button_qss)
 
     def closeEvent(self, event) -> None:
         """Handle window close event."""
@@ -1145,6 +1155,10 @@ class MainWindow(QMainWindow):
         if self.scan_manager is not None and self.scan_manager.is_scanning():
             self.scan_manager.stop()
 
+        # Let a pending connection attempt finish so its thread isn't destroyed while running
+        if self._connect_manager is not None:
+            self._connect_manager.wait()
+
         # Disconnect from device
         if self._using_simulator:
             if self.simulator.is_connected():
@@ -1253,7 +1267,7 @@ class MainWindow(QMainWindow):
         # Update UI
         config_name = self.config_loader.get_config_file_name()
         self.lbl_config_file.setText(config_name)
-        self.lbl_config_file.setStyleSheet("color: #51cf66; font-weight: bold;")
+        self.lbl_config_file.setStyleSheet(_STATUS_OK_QSS)
         
         self.status_updated.emit(message)
         logger.info(f"Configuration loaded successfully: {message}")
@@ -1280,18 +1294,16 @@ class MainWindow(QMainWindow):
                 indicator = self.channel_indicators[channel_num - 1]
                 
                 # Set measurement type
-                indicator.set_measurement_type(config.measurement_type)
+                applied_range = indicator.set_measurement_type(config.measurement_type)
                 
                 # Update internal measurement type mapping
                 self._channel_measurement_types[channel_num] = config.measurement_type
                 
-                # Set range if specified
+                # Set range if specified (otherwise keep the range the type change fell back to)
                 if config.range_value:
-                    indicator.set_range(config.range_value)
-                    self._channel_ranges[channel_num] = config.range_value
-                else:
-                    # Default to AUTO if not specified
-                    self._channel_ranges[channel_num] = "AUTO"
+                    applied_range = indicator.set_range(config.range_value)
+                # Record the range the channel actually uses, e.g. "2 A" for AUTO on current channels
+                self._channel_ranges[channel_num] = applied_range
                 
                 # Set thresholds
                 indicator.set_thresholds(config.lower_threshold, config.upper_threshold)
@@ -1330,20 +1342,20 @@ class MainWindow(QMainWindow):
 
         if text == "":
             # Empty input - use default color
-            self.serial_number_input.setStyleSheet("")
+            _set_style_sheet(self.serial_number_input, "")
         elif re.match(pattern, text):
             # Valid format - check if it exists in report
             if self._check_serial_in_report(text):
                 # Serial number exists in report - green color
-                self.serial_number_input.setStyleSheet("color: #51cf66; font-weight: bold;")
+                _set_style_sheet(self.serial_number_input, _STATUS_OK_QSS)
                 logger.debug(f"Valid serial number (exists in report): {text}")
             else:
                 # Serial number doesn't exist - white color
-                self.serial_number_input.setStyleSheet("color: white;")
+                _set_style_sheet(self.serial_number_input, _SERIAL_NEW_QSS)
                 logger.debug(f"Valid serial number (new): {text}")
         else:
             # Invalid format - red color
-            self.serial_number_input.setStyleSheet("color: red;")
+            _set_style_sheet(self.serial_number_input, _SERIAL_INVALID_QSS)
             logger.debug(f"Invalid serial number: {text}")
 
     def _on_select_report_file(self) -> None:
@@ -1365,7 +1377,7 @@ class MainWindow(QMainWindow):
         # Update the shared label to show the filename
         filename = os.path.basename(file_path)
         self.lbl_report_file.setText(filename)
-        self.lbl_report_file.setStyleSheet("color: #51cf66; font-weight: bold;")
+        self.lbl_report_file.setStyleSheet(_STATUS_OK_QSS)
         
         self.status_updated.emit(f"Report file selected: {filename}")
         logger.info(f"Report file selected: {file_path}")
@@ -1398,7 +1410,7 @@ class MainWindow(QMainWindow):
             # Update the shared label to show the filename
             filename = os.path.basename(file_path)
             self.lbl_report_file.setText(filename)
-            self.lbl_report_file.setStyleSheet("color: #51cf66; font-weight: bold;")
+            self.lbl_report_file.setStyleSheet(_STATUS_OK_QSS)
             
             self.status_updated.emit(f"New report file created: {filename}")
             logger.info(f"New report file created: {file_path}")
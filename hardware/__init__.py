@@ -4,6 +4,6 @@ Hardware abstraction layer for SDM4055A-SC multimeter.
 
 from .visa_interface import VisaInterface, MeasurementType, ChannelConfig
 from .simulator import VisaSimulator
-from .async_worker import ScanWorker, AsyncScanManager
+from .async_worker import ScanWorker, AsyncScanManager, AsyncConnectManager, LatestValueSlot
 
-__all__ = ["VisaInterface", "VisaSimulator", "MeasurementType", "ChannelConfig", "ScanWorker", "AsyncScanManager"]
+__all__ = ["VisaInterface", "VisaSimulator", "MeasurementType", "ChannelConfig", "ScanWorker", "AsyncScanManager", "AsyncConnectManager", "LatestValueSlot"]
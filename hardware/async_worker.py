@@ -2,15 +2,57 @@
 Async worker thread for device operations to keep UI responsive.
 """
 
-from PySide6.QtCore import QThread, Signal, QObject, QMutex, QMutexLocker
+from PySide6.QtCore import QThread, Signal, QObject, QMutex, QMutexLocker, QWaitCondition
 from typing import Dict, Optional
 import logging
+import time
 
 from .visa_interface import MeasurementType, ScanDataResult
 
 logger = logging.getLogger(__name__)
 
 
+class LatestValueSlot:
+    """
+    Single-value mailbox between a producer thread and the GUI thread.
+
+    The producer overwrites the slot with publish() and never blocks; the consumer
+    calls consume() and sees each published value at most once, so values that are
+    superseded before the consumer catches up are dropped. Each call performs a single
+    attribute store or load, which is atomic in CPython, so no lock is needed for
+    one producer and one consumer.
+    """
+
+    __slots__ = ("_item", "_consumed_seq")
+
+    def __init__(self):
+        """Initialize an empty slot."""
+        self._item = (0, None)
+        self._consumed_seq = 0
+
+    def publish(self, value) -> None:
+        """
+        Replace the slot content with a new value (producer side).
+
+        Args:
+            value: Value to publish.
+        """
+        self._item = (self._item[0] + 1, value)
+
+    def consume(self):
+        """
+        Take the latest value if it has not been consumed yet (consumer side).
+
+        Returns:
+            The latest published value, or None if nothing new was published.
+        """
+        seq, value = self._item
+        if seq == self._consumed_seq:
+            return None
+        self._consumed_seq = seq
+        return value
+
+
 class ScanWorker(QObject):
     """
     Worker object that performs device scanning operations in a background thread.
@@ -23,21 +65,24 @@ class ScanWorker(QObject):
     # Emitted when a full scan completes with results (using object for thread safety)
     scan_complete = Signal(object)
     scan_error = Signal(str)  # Emitted when an error occurs
-    channel_read = Signal(int, object)  # Emitted when a single channel is read (ScanDataResult or None)
     scan_started = Signal()  # Emitted when scanning starts
     scan_stopped = Signal()  # Emitted when scanning stops
 
-    def __init__(self, device):
+    def __init__(self, device, latest_measurements: Optional[LatestValueSlot] = None):
         """
         Initialize the scan worker.
 
         Args:
             device: Device interface (VisaInterface or VisaSimulator)
+            latest_measurements: Slot receiving each scan's measurements for the GUI
         """
         super().__init__()
         self._device = device
+        self._latest_measurements = latest_measurements
         self._running = False
         self._mutex = QMutex()
+        # Wakes the scan loop early when scanning is stopped
+        self._stop_requested = QWaitCondition()
         self._interval = 2000  # Default 2 seconds
 
     def set_interval(self, interval_ms: int) -> None:
@@ -45,7 +90,7 @@ class ScanWorker(QObject):
         Set the scan interval.
 
         Args:
-            interval_ms: Interval in milliseconds between scans.
+            interval_ms: Interval in milliseconds between scan starts.
         """
         with QMutexLocker(self._mutex):
             self._interval = interval_ms
@@ -68,6 +113,7 @@ class ScanWorker(QObject):
                 if not self._running:
                     break
                 interval = self._interval
+            scan_start = time.monotonic()
 
             # Perform scan
             try:
@@ -80,14 +126,11 @@ class ScanWorker(QObject):
                 # Read all channels
                 measurements = self._device.read_all_channels()
 
-                # Emit results
+                # Publish results, then wake the GUI once with scan_complete
+                if self._latest_measurements is not None:
+                    self._latest_measurements.publish(measurements)
                 self.scan_complete.emit(measurements)
 
-                # Also emit individual channel reads for progress feedback
-                for channel_num, value in measurements.items():
-                    if value is not None:
-                        self.channel_read.emit(channel_num, value)
-
                 logger.debug(
                     f"Scan completed: {len(measurements)} channels read")
 
@@ -97,9 +140,12 @@ class ScanWorker(QObject):
                 self.scan_error.emit(error_msg)
                 break
 
-            # Wait for interval
-            import time
-            time.sleep(interval / 1000.0)
+            # Wait out the rest of the interval, so the scan time is not added on top
+            # of it; stop_scanning() ends the wait immediately
+            remaining_ms = int(interval - (time.monotonic() - scan_start) * 1000)
+            with QMutexLocker(self._mutex):
+                if self._running and remaining_ms > 0:
+                    self._stop_requested.wait(self._mutex, remaining_ms)
 
         # Emit scan_stopped when loop exits (either stopped or error)
         self.scan_stopped.emit()
@@ -112,6 +158,7 @@ class ScanWorker(QObject):
                 logger.warning("Scanning not running")
                 return
             self._running = False
+            self._stop_requested.wakeAll()
 
         logger.info("Scan worker stop requested")
 
@@ -238,6 +285,8 @@ class AsyncScanManager(QObject):
         self._worker: Optional[ScanWorker] = None
         self._scanning = False
         self._channel_configs: Dict[int, Dict[str, str]] = {}  # Stores {'measurement_type': str, 'range_value': str}
+        # Latest continuous scan results, taken by the GUI when scan_complete arrives
+        self.latest_measurements = LatestValueSlot()
 
     def start(self, interval_ms: int = 2000) -> bool:
         """
@@ -260,7 +309,7 @@ class AsyncScanManager(QObject):
         try:
             # Create thread and worker
             self._thread = QThread()
-            self._worker = ScanWorker(self._device)
+            self._worker = ScanWorker(self._device, self.latest_measurements)
             self._worker.moveToThread(self._thread)
 
             # Set interval
@@ -269,7 +318,6 @@ class AsyncScanManager(QObject):
             # Forward worker signals to manager signals
             self._worker.scan_complete.connect(self.scan_complete)
             self._worker.scan_error.connect(self.scan_error)
-            self._worker.channel_read.connect(self.channel_read)
             self._worker.scan_started.connect(self.scan_started)
             self._worker.scan_stopped.connect(self._on_worker_scan_stopped)
 
@@ -552,3 +600,116 @@ class AsyncScanManager(QObject):
         """Cleanup on deletion."""
         self.stop()
         self._cleanup()
+
+
+class ConnectWorker(QObject):
+    """
+    Worker object that opens the device connection in a background thread.
+
+    Opening a VISA session and running the instrument initialization can take
+    several seconds, so it is kept off the GUI thread.
+    """
+
+    # Emitted with the connection result and device info (empty dict on failure)
+    connect_finished = Signal(bool, object)
+
+    def __init__(self, device):
+        """
+        Initialize the connect worker.
+
+        Args:
+            device: Device interface (VisaInterface or VisaSimulator)
+        """
+        super().__init__()
+        self._device = device
+
+    def run_connect(self) -> None:
+        """Connect to the device and query its identification."""
+        device_info = {}
+        try:
+            success = self._device.connect()
+            if success:
+                device_info = self._device.get_device_info()
+        except Exception as e:
+            logger.error(f"Connect error: {e}")
+            success = False
+
+        self.connect_finished.emit(success, device_info)
+
+        # Quit thread event loop to prevent hanging
+        QThread.currentThread().quit()
+
+
+class AsyncConnectManager(QObject):
+    """
+    Manager for connecting to a device without blocking the UI.
+
+    This class owns the QThread and ConnectWorker for a single connection attempt.
+    """
+
+    # Signals for external connection
+    connect_finished = Signal(bool, object)
+
+    def __init__(self, device):
+        """
+        Initialize the async connect manager.
+
+        Args:
+            device: Device interface (VisaInterface or VisaSimulator)
+        """
+        super().__init__()
+        self._device = device
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[ConnectWorker] = None
+
+    def start(self) -> bool:
+        """
+        Start connecting in a background thread.
+
+        Returns:
+            True if the connection attempt was started, False otherwise.
+        """
+        if self._thread is not None:
+            logger.warning("Connection attempt already in progress")
+            return False
+
+        try:
+            self._thread = QThread()
+            self._thread.setObjectName("ConnectThread")  # Set thread name for debugging
+
+            self._worker = ConnectWorker(self._device)
+            self._worker.moveToThread(self._thread)
+
+            # Forward worker signals to manager signals
+            self._worker.connect_finished.connect(self.connect_finished)
+
+            # Connect thread lifecycle
+            self._thread.started.connect(self._worker.run_connect)
+            self._thread.finished.connect(self._on_thread_finished)
+
+            self._thread.start()
+            logger.info("Connection attempt started")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to start connection attempt: {e}")
+            self._thread = None
+            self._worker = None
+            return False
+
+    def wait(self, timeout_ms: int = 5000) -> None:
+        """
+        Block until a running connection attempt finishes.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds.
+        """
+        if self._thread is not None and not self._thread.wait(timeout_ms):
+            logger.warning("Connect thread did not finish in time")
+
+    def _on_thread_finished(self) -> None:
+        """Handle connect thread finished."""
+        logger.debug("Connect thread finished")
+        # Just clear the references, let Qt clean up when ready
+        self._thread = None
+        self._worker = None
@@ -3,7 +3,7 @@ VISA interface for SDM4055A-SC multimeter communication.
 """
 
 import pyvisa
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import logging
 import time
 from enum import Enum
@@ -12,6 +12,23 @@ from PySide6.QtCore import QMutex, QMutexLocker
 
 logger = logging.getLogger(__name__)
 
+# VISA resource manager shared by all interfaces; opening one loads the VISA library
+# and starts a new VISA session, so it is created once per process
+_resource_manager: Optional[pyvisa.ResourceManager] = None
+
+
+def _get_resource_manager() -> pyvisa.ResourceManager:
+    """
+    Get the shared VISA resource manager, creating it on first use.
+
+    Returns:
+        The process-wide pyvisa ResourceManager.
+    """
+    global _resource_manager
+    if _resource_manager is None:
+        _resource_manager = pyvisa.ResourceManager()
+    return _resource_manager
+
 
 @dataclass
 class ScanDataResult:
@@ -80,6 +97,10 @@ class VisaInterface:
         self._channel_configs: Dict[int, ChannelConfig] = {}
         self._initialize_channels()
 
+        # Scan settings last written to the instrument, so unchanged ones are not resent every scan
+        self._applied_scan_configs: Dict[int, Tuple[MeasurementType, str]] = {}
+        self._applied_scan_limits: Optional[Tuple[int, int]] = None
+
     def connect(self) -> bool:
         """
         Establish connection to multimeter.
@@ -93,9 +114,9 @@ class VisaInterface:
                 logger.info("MULTIMETER INITIALIZATION STARTED")
                 logger.info("=" * 80)
                 
-                logger.info("Step 1: Creating VISA Resource Manager...")
-                self.rm = pyvisa.ResourceManager()
-                logger.info("  VISA Resource Manager created successfully")
+                logger.info("Step 1: Getting VISA Resource Manager...")
+                self.rm = _get_resource_manager()
+                logger.info("  VISA Resource Manager ready")
 
                 # Auto-detect device if resource string not provided
                 if not self.resource_string:
@@ -185,12 +206,15 @@ class VisaInterface:
                 self._connected = False
                 return False
 
-    def _check_and_log_errors(self, operation_name: str = "operation") -> None:
+    def _check_and_log_errors(self, operation_name: str = "operation") -> bool:
         """
         Check for device errors and log them.
 
         Args:
             operation_name: Name of the operation that was performed (for logging).
+
+        Returns:
+            True if the error queue was clean, False if errors were reported or it could not be queried.
         """
         try:
             # Query system error status to detect any errors
@@ -216,10 +240,12 @@ class VisaInterface:
                         logger.error(f"  Error queue [{i}]: {error_query}")
                 except pyvisa.Error as e:
                     logger.warning(f"Could not query additional error details: {e}")
-            else:
-                logger.debug(f"After {operation_name}: No device errors")
+                return False
+            logger.debug(f"After {operation_name}: No device errors")
+            return True
         except pyvisa.Error as e:
             logger.warning(f"Could not query error status after {operation_name}: {e}")
+            return False
 
     def disconnect(self) -> None:
         """Terminate connection to multimeter."""
@@ -228,11 +254,11 @@ class VisaInterface:
                 if self.instrument:
                     self.instrument.close()
                     self.instrument = None
-                if self.rm:
-                    self.rm.close()
-                    self.rm = None
+                # The resource manager is shared and stays open for later connections
+                self.rm = None
                 self._connected = False
                 self._scan_mode_enabled = False
+                self._clear_applied_scan_settings()
                 logger.info("Disconnected from device")
             except Exception as e:
                 logger.error(f"Error during disconnection: {e}")
@@ -299,6 +325,32 @@ class VisaInterface:
             logger.error(f"Unexpected error during function set: {e}")
             return False
 
+    # Mapping of measurement types to CS1016 channel types used by :ROUT:CHAN
+    MEASUREMENT_TO_CHANNEL_TYPE = {
+        MeasurementType.VOLTAGE_DC: "DCV",
+        MeasurementType.VOLTAGE_AC: "ACV",
+        MeasurementType.CURRENT_DC: "DCI",  # DCI (not DCA) for DC current
+        MeasurementType.CURRENT_AC: "ACI",  # ACI (not ACA) for AC current
+        MeasurementType.RESISTANCE_2WIRE: "RES",
+        MeasurementType.RESISTANCE_4WIRE: "RES",
+        MeasurementType.CAPACITANCE: "CAP",
+        MeasurementType.FREQUENCY: "FREQ",
+        MeasurementType.DIODE: "DIOD",
+        MeasurementType.CONTINUITY: "CONT",
+        MeasurementType.TEMP_RTD: "RTD",
+        MeasurementType.TEMP_THERMOCOUPLE: "THER",
+    }
+
+    # Mapping of unit suffixes in :ROUT:DATA? responses to base units
+    FULL_UNIT_TO_BASE_UNIT = {
+        "VDC": "V", "VAC": "V",
+        "ADC": "A", "AAC": "A",
+        "OHM": "Ω", "OHMS": "Ω",
+        "F": "F",
+        "HZ": "Hz", "HERTZ": "Hz",
+        "DEGC": "°C", "DEGF": "°F",
+    }
+
     # Mapping of range values to SCPI range commands (CS1016 supported ranges only)
     # IMPORTANT: CS1016 scanning card has DIFFERENT range limitations than the multimeter itself!
     # See doc/CS1016_Supported_Ranges.md for detailed information
@@ -437,6 +489,11 @@ class VisaInterface:
         logger.info(f"Set channel {channel_num} range to {range_value}")
         return True
 
+    def _clear_applied_scan_settings(self) -> None:
+        """Forget the scan settings written to the instrument so the next scan resends them."""
+        self._applied_scan_configs.clear()
+        self._applied_scan_limits = None
+
     def enable_scan_mode(self) -> bool:
         """
         Enable CS1016 scan mode.
@@ -449,6 +506,9 @@ class VisaInterface:
             return False
 
         try:
+            # Entering scan mode starts from a fresh instrument state
+            self._clear_applied_scan_settings()
+
             # Enable scan mode
             logger.info("Sending: :ROUT:SCAN ON")
             self.instrument.write(":ROUT:SCAN ON")
@@ -514,22 +574,7 @@ class VisaInterface:
 
         try:
             # Convert MeasurementType to CS1016 channel type
-            type_map = {
-                MeasurementType.VOLTAGE_DC: "DCV",
-                MeasurementType.VOLTAGE_AC: "ACV",
-                MeasurementType.CURRENT_DC: "DCI",  # DCI (not DCA) for DC current
-                MeasurementType.CURRENT_AC: "ACI",  # ACI (not ACA) for AC current
-                MeasurementType.RESISTANCE_2WIRE: "RES",
-                MeasurementType.RESISTANCE_4WIRE: "RES",
-                MeasurementType.CAPACITANCE: "CAP",
-                MeasurementType.FREQUENCY: "FREQ",
-                MeasurementType.DIODE: "DIOD",
-                MeasurementType.CONTINUITY: "CONT",
-                MeasurementType.TEMP_RTD: "RTD",
-                MeasurementType.TEMP_THERMOCOUPLE: "THER",
-            }
-            
-            channel_type = type_map.get(config.measurement_type, "DCV")
+            channel_type = self.MEASUREMENT_TO_CHANNEL_TYPE.get(config.measurement_type, "DCV")
             
             # Get SCPI range command from range value
             range_scpi = self.RANGE_TO_SCPI.get(config.range_value, "AUTO")
@@ -549,7 +594,11 @@ class VisaInterface:
             time.sleep(0.05)  # 50ms delay
             
             # Check for errors after configuration using the helper method
-            self._check_and_log_errors(f"configure channel {channel_num} ({cmd})")
+            # Only remember settings the device accepted, so rejected ones are resent next scan
+            if self._check_and_log_errors(f"configure channel {channel_num} ({cmd})"):
+                self._applied_scan_configs[channel_num] = (config.measurement_type, config.range_value)
+            else:
+                self._applied_scan_configs.pop(channel_num, None)
             
             logger.debug(f"Configured channel {channel_num} as {channel_type} with range {range_scpi}")
             return True
@@ -564,10 +613,16 @@ class VisaInterface:
         """
         Configure all channels for scanning.
 
+        Channels whose measurement type and range are unchanged since they were
+        last written to the instrument are skipped.
+
         Returns:
             True if successful, False otherwise.
         """
         for channel_num in range(1, 17):
+            config = self._channel_configs.get(channel_num)
+            if config and self._applied_scan_configs.get(channel_num) == (config.measurement_type, config.range_value):
+                continue
             if not self.configure_scan_channel(channel_num):
                 logger.error(f"Failed to configure channel {channel_num}")
                 return False
@@ -592,19 +647,24 @@ class VisaInterface:
             logger.error(f"Invalid scan limits: low={low}, high={high}")
             return False
 
+        if self._applied_scan_limits == (low, high):
+            return True
+
         try:
             # Set high limit
             logger.debug(f"Sending: :ROUT:LIMI:HIGH {high}")
             self.instrument.write(f":ROUT:LIMI:HIGH {high}")
             time.sleep(0.1)  # 100ms delay
-            self._check_and_log_errors(f"set high scan limit to {high}")
+            high_ok = self._check_and_log_errors(f"set high scan limit to {high}")
             
             # Set low limit
             logger.debug(f"Sending: :ROUT:LIMI:LOW {low}")
             self.instrument.write(f":ROUT:LIMI:LOW {low}")
             time.sleep(0.1)  # 100ms delay
-            self._check_and_log_errors(f"set low scan limit to {low}")
+            low_ok = self._check_and_log_errors(f"set low scan limit to {low}")
             
+            # Only remember limits the device accepted, so rejected ones are resent next scan
+            self._applied_scan_limits = (low, high) if high_ok and low_ok else None
             logger.info(f"Set scan limits: {low} to {high}")
             return True
         except pyvisa.Error as e:
@@ -749,16 +809,7 @@ class VisaInterface:
                 full_unit = parts[1] if len(parts) > 1 else ""
                 
                 # Map full unit to base unit
-                unit_mapping = {
-                    "VDC": "V", "VAC": "V",
-                    "ADC": "A", "AAC": "A",
-                    "OHM": "Ω", "OHMS": "Ω",
-                    "F": "F",
-                    "HZ": "Hz", "HERTZ": "Hz",
-                    "DEGC": "°C", "DEGF": "°F",
-                }
-                
-                base_unit = unit_mapping.get(full_unit, "")
+                base_unit = self.FULL_UNIT_TO_BASE_UNIT.get(full_unit, "")
                 
                 logger.debug(f"Channel {channel_num}: value={value}, full_unit={full_unit}, base_unit={base_unit}")
                 
@@ -855,6 +906,8 @@ class VisaInterface:
             Dictionary mapping channel numbers to ScanDataResult objects (or None if failed).
         """
         logger.info("Reading channels sequentially...")
+        # The scan setup failed or was abandoned, so resend every setting on the next scan
+        self._clear_applied_scan_settings()
         results = {}
         
         for channel_num in range(1, 17):
@@ -910,17 +963,8 @@ class VisaInterface:
             List of VISA resource strings, or empty list if no resources found.
         """
         with QMutexLocker(self._mutex):
-            # Create temporary resource manager if not initialized
-            temp_rm = None
             try:
-                if not self.rm:
-                    logger.info("Creating temporary resource manager for listing resources")
-                    temp_rm = pyvisa.ResourceManager()
-                    rm_to_use = temp_rm
-                else:
-                    rm_to_use = self.rm
-                
-                resources = rm_to_use.list_resources()
+                resources = _get_resource_manager().list_resources()
                 logger.info(f"Found {len(resources)} available VISA resources")
                 return resources
             except pyvisa.Error as e:
@@ -929,14 +973,6 @@ class VisaInterface:
             except Exception as e:
                 logger.error(f"Unexpected error listing resources: {e}")
                 return []
-            finally:
-                # Clean up temporary resource manager if we created one
-                if temp_rm is not None:
-                    try:
-                        temp_rm.close()
-                        logger.debug("Closed temporary resource manager")
-                    except Exception as e:
-                        logger.warning(f"Error closing temporary resource manager: {e}")
 
     def get_device_info(self) -> Dict[str, str]:
         """
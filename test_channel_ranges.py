@@ -0,0 +1,93 @@
+"""
+Test script for channel range bookkeeping.
+Tests that the main window's range mapping matches the ranges the channels use.
+"""
+
+import os
+import sys
+import tempfile
+
+from PySide6.QtWidgets import QApplication
+from gui.widgets import ChannelIndicator
+from gui.window import MainWindow
+
+# Create QApplication instance once
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_programmatic_changes_are_silent():
+    """Test that set_measurement_type/set_range only emit when asked and return the applied range."""
+    indicator = ChannelIndicator(channel_num=1)
+    emitted = []
+    indicator.measurement_type_changed.connect(lambda ch, mt: emitted.append(("type", ch, mt)))
+    indicator.range_changed.connect(lambda ch, rv: emitted.append(("range", ch, rv)))
+
+    assert indicator.set_measurement_type("RES") == "AUTO"
+    assert indicator.set_range("20 kOhm") == "20 kOhm"
+    # 20 kOhm is not a voltage range, so switching type falls back to AUTO
+    assert indicator.set_measurement_type("VOLT:DC") == "AUTO"
+    # Unknown ranges are ignored
+    assert indicator.set_range("2 A") == "AUTO"
+    assert emitted == []
+
+    assert indicator.set_measurement_type("RES", emit=True) == "AUTO"
+    assert emitted == [("type", 1, "RES")]
+    print("  [PASS] Programmatic changes are silent and return the applied range")
+
+
+def test_window_ranges_match_channels():
+    """Test that the window's range mapping matches get_range() after construction."""
+    window = MainWindow()
+    for channel_num in range(1, 17):
+        indicator = window.channel_indicators[channel_num - 1]
+        assert window._channel_ranges[channel_num] == indicator.get_range(), channel_num
+    for channel_num in range(13, 17):
+        assert window._channel_ranges[channel_num] == "2 A", channel_num
+    print("  [PASS] Window ranges match the channels after construction")
+
+
+def test_applied_configuration_ranges_match_channels():
+    """Test that applying a configuration records the ranges the channels actually use."""
+    window = MainWindow()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("channel,Name,measurement_type,range,lower_threshold,upper_threshold\n"
+                    "1,,RES,20 kOhm,,\n"
+                    "13,,CURR:DC,AUTO,,\n")
+        success, message = window.config_loader.load_from_file(path)
+        assert success, message
+    window._apply_configuration()
+
+    assert window._channel_ranges[1] == "20 kOhm"
+    assert window._channel_ranges[13] == "2 A"
+    for channel_num in range(1, 17):
+        indicator = window.channel_indicators[channel_num - 1]
+        assert window._channel_ranges[channel_num] == indicator.get_range(), channel_num
+    print("  [PASS] Applied configuration ranges match the channels")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Channel Range Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_programmatic_changes_are_silent,
+        test_window_ranges_match_channels,
+        test_applied_configuration_ranges_match_channels,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAIL] {test.__name__}: {e}")
+
+    print("=" * 60)
+    if failed:
+        print(f"\n[FAILURE] {failed} test(s) failed!")
+        sys.exit(1)
+    print("\n[SUCCESS] All tests passed!")
+    sys.exit(0)
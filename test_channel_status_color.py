@@ -0,0 +1,64 @@
+"""
+Test script for channel value label color states.
+Tests that status colors are cleared once valid readings come back.
+"""
+
+import sys
+
+from PySide6.QtWidgets import QApplication
+from gui.widgets import ChannelIndicator
+
+# Create QApplication instance once
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+def test_error_state_cleared_by_value():
+    """Test that a valid reading after an error status clears the red state."""
+    indicator = ChannelIndicator(channel_num=1)
+
+    indicator.set_status("No data", error=True)
+    assert indicator.value_label.property("state") == "error"
+
+    indicator.set_value(2.0, "V")
+    assert indicator.value_label.text() == "2.000000 V"
+    assert indicator.value_label.property("state") == "", indicator.value_label.property("state")
+    print("  [PASS] Valid reading clears the error state")
+
+
+def test_threshold_state_survives_value():
+    """Test that threshold colors still apply after an error status."""
+    indicator = ChannelIndicator(channel_num=1)
+    indicator.set_thresholds(1.0, 3.0)
+
+    indicator.set_status("No data", error=True)
+    indicator.set_value(5.0, "V")
+    assert indicator.value_label.property("state") == "out_of_range"
+
+    indicator.set_value(2.0, "V")
+    assert indicator.value_label.property("state") == "in_range"
+    print("  [PASS] Threshold colors apply after an error status")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Channel Status Color Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_error_state_cleared_by_value,
+        test_threshold_state_survives_value,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAIL] {test.__name__}: {e}")
+
+    print("=" * 60)
+    if failed:
+        print(f"\n[FAILURE] {failed} test(s) failed!")
+        sys.exit(1)
+    print("\n[SUCCESS] All tests passed!")
+    sys.exit(0)
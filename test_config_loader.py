@@ -0,0 +1,158 @@
+"""
+Test script for the channel configuration loader.
+Tests CSV parsing, error messages and the parsed-file cache.
+"""
+
+import os
+import sys
+import tempfile
+
+from config.config_loader import ConfigLoader
+
+HEADER = "channel,Name,measurement_type,range,lower_threshold,upper_threshold\n"
+
+
+def _write_config(directory: str, content: str, name: str = "config.csv") -> str:
+    """Write a configuration file and return its path."""
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def test_short_rows_are_padded():
+    """Test that rows missing trailing columns load with empty thresholds."""
+    ConfigLoader._PARSE_CACHE.clear()
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_config(directory, HEADER + "1,Input,VOLT:DC\n2,,VOLT:DC,2 V,1.5\n")
+        loader = ConfigLoader()
+        success, message = loader.load_from_file(path)
+        assert success, message
+
+        config = loader.get_channel_config(1)
+        assert config.name == "Input"
+        assert config.range_value == "AUTO"
+        assert config.lower_threshold is None and config.upper_threshold is None
+
+        config = loader.get_channel_config(2)
+        assert config.range_value == "2 V"
+        assert config.lower_threshold == 1.5 and config.upper_threshold is None
+    print("  [PASS] Short rows are padded with empty cells")
+
+
+def test_comments_and_blank_lines_skipped():
+    """Test that the sample configuration, with its comment block, loads."""
+    ConfigLoader._PARSE_CACHE.clear()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sample.csv")
+        loader = ConfigLoader()
+        assert loader.create_sample_config(path)[0]
+        success, message = loader.load_from_file(path)
+        assert success, message
+        assert loader.get_configured_channels() == [1, 2, 3, 4, 5, 13, 14]
+        assert loader.get_channel_config(2).range_value == "200 mV"
+    print("  [PASS] Comments and blank lines are skipped")
+
+
+def test_error_messages_report_row():
+    """Test that parse errors name the offending row and value."""
+    ConfigLoader._PARSE_CACHE.clear()
+    cases = [
+        ("1,,VOLT:DC,AUTO,abc,\n", "Row 2: Invalid lower threshold 'abc'"),
+        ("1,,VOLT:DC,AUTO,,1_0x\n", "Row 2: Invalid upper threshold '1_0x'"),
+        ("1,,VOLT:DC,AUTO,\n17,,VOLT:DC,AUTO,\n", "Row 3: Channel number must be between 1 and 16"),
+        ("13,,VOLT:DC,AUTO,,\n", "Row 2: Only current measurements supported on channel 13 (channels 13-16)"),
+        ("1,,VOLT:DC,AUTO,2,1\n", "Row 2: Lower threshold (2.0) must be less than upper threshold (1.0)"),
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        for rows, expected in cases:
+            path = _write_config(directory, HEADER + rows)
+            success, message = ConfigLoader().load_from_file(path)
+            assert not success
+            assert message == expected, f"{message!r} != {expected!r}"
+    print("  [PASS] Error messages report the row and value")
+
+
+def test_threshold_number_formats():
+    """Test that thresholds accept the same number formats as float()."""
+    ConfigLoader._PARSE_CACHE.clear()
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_config(directory, HEADER + "1,,VOLT:DC,AUTO,-1_000,1e3\n")
+        loader = ConfigLoader()
+        success, message = loader.load_from_file(path)
+        assert success, message
+        config = loader.get_channel_config(1)
+        assert (config.lower_threshold, config.upper_threshold) == (-1000.0, 1000.0)
+
+        path = _write_config(directory, HEADER + "1,,VOLT:DC,AUTO,1__0,\n")
+        success, message = ConfigLoader().load_from_file(path)
+        assert not success
+        assert message == "Row 2: Invalid lower threshold '1__0'"
+    print("  [PASS] Thresholds accept float() number formats")
+
+
+def test_cache_returns_copies():
+    """Test that a cached load does not share config objects with earlier loads."""
+    ConfigLoader._PARSE_CACHE.clear()
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_config(directory, HEADER + "1,Input,VOLT:DC,AUTO,1,2\n")
+        first = ConfigLoader()
+        assert first.load_from_file(path)[0]
+        first.get_channel_config(1).upper_threshold = 5.0
+
+        second = ConfigLoader()
+        success, message = second.load_from_file(path)
+        assert success, message
+        config = second.get_channel_config(1)
+        assert config is not first.get_channel_config(1)
+        assert config.upper_threshold == 2.0
+    print("  [PASS] Cached loads return independent copies")
+
+
+def test_cache_invalidated_on_change():
+    """Test that modifying the file makes the next load parse it again."""
+    ConfigLoader._PARSE_CACHE.clear()
+    with tempfile.TemporaryDirectory() as directory:
+        path = _write_config(directory, HEADER + "1,Input,VOLT:DC,AUTO,1,2\n")
+        loader = ConfigLoader()
+        assert loader.load_from_file(path)[0]
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        # Same size content, with the modification time moved forward explicitly
+        _write_config(directory, HEADER + "1,Input,VOLT:DC,AUTO,3,4\n")
+        os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+        success, message = loader.load_from_file(path)
+        assert success, message
+        config = loader.get_channel_config(1)
+        assert (config.lower_threshold, config.upper_threshold) == (3.0, 4.0)
+    print("  [PASS] Cache is invalidated when the file changes")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Configuration Loader Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_short_rows_are_padded,
+        test_comments_and_blank_lines_skipped,
+        test_error_messages_report_row,
+        test_threshold_number_formats,
+        test_cache_returns_copies,
+        test_cache_invalidated_on_change,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAIL] {test.__name__}: {e}")
+
+    print("=" * 60)
+    if failed:
+        print(f"\n[FAILURE] {failed} test(s) failed!")
+        sys.exit(1)
+    print("\n[SUCCESS] All tests passed!")
+    sys.exit(0)
@@ -0,0 +1,162 @@
+"""
+Test script for CS1016 scan setting caching.
+Tests that unchanged channel settings and scan limits are not resent before every scan.
+"""
+
+import sys
+from unittest import mock
+
+from hardware.visa_interface import VisaInterface
+
+
+class RecordingInstrument:
+    """Minimal instrument double that records writes and answers scan queries."""
+
+    def __init__(self):
+        self.writes = []
+        # Commands whose next :SYST:ERR? query reports an error
+        self.rejected = set()
+        self._pending_error = False
+
+    def write(self, command: str) -> None:
+        self.writes.append(command)
+        if command in self.rejected:
+            self._pending_error = True
+
+    def query(self, command: str) -> str:
+        if command.startswith(":ROUT:START?"):
+            return "OFF"
+        if command.startswith(":SYST:ERR"):
+            if self._pending_error:
+                self._pending_error = False
+                return '-222,"Data out of range"'
+            return '0,"No error"'
+        if command.startswith(":ROUT:DATA?"):
+            return "1.00000000E+00 VDC"
+        return "ON"
+
+    def close(self) -> None:
+        pass
+
+
+def _connected_interface() -> VisaInterface:
+    """Create an interface that talks to a RecordingInstrument."""
+    visa = VisaInterface()
+    visa.instrument = RecordingInstrument()
+    visa._connected = True
+    return visa
+
+
+def _channel_writes(visa: VisaInterface):
+    """Return the :ROUT:CHAN and :ROUT:LIMI commands written since the last reset."""
+    return [c for c in visa.instrument.writes if c.startswith((":ROUT:CHAN", ":ROUT:LIMI"))]
+
+
+def test_unchanged_settings_not_resent():
+    """Test that a second scan only starts the scan."""
+    with mock.patch("hardware.visa_interface.time.sleep"):
+        visa = _connected_interface()
+        visa.read_all_channels()
+        assert len([c for c in _channel_writes(visa) if c.startswith(":ROUT:CHAN")]) == 16
+
+        visa.instrument.writes.clear()
+        results = visa.read_all_channels()
+        assert _channel_writes(visa) == []
+        assert results[1].value == 1.0
+    print("  [PASS] Unchanged settings are not resent")
+
+
+def test_changed_channel_resent():
+    """Test that only a changed channel is reconfigured."""
+    with mock.patch("hardware.visa_interface.time.sleep"):
+        visa = _connected_interface()
+        visa.read_all_channels()
+
+        assert visa.set_channel_range(3, "2 V")
+        visa.instrument.writes.clear()
+        visa.read_all_channels()
+        assert _channel_writes(visa) == [":ROUT:CHAN 3,ON,DCV,2V,FAST"]
+    print("  [PASS] Only the changed channel is resent")
+
+
+def test_rejected_settings_resent():
+    """Test that settings the device reported an error for are sent again on the next scan."""
+    with mock.patch("hardware.visa_interface.time.sleep"):
+        visa = _connected_interface()
+        visa.instrument.rejected = {":ROUT:CHAN 3,ON,DCV,AUTO,FAST", ":ROUT:LIMI:LOW 1"}
+        visa.read_all_channels()
+
+        visa.instrument.rejected = set()
+        visa.instrument.writes.clear()
+        visa.read_all_channels()
+        assert _channel_writes(visa) == [
+            ":ROUT:CHAN 3,ON,DCV,AUTO,FAST",
+            ":ROUT:LIMI:HIGH 16",
+            ":ROUT:LIMI:LOW 1",
+        ], _channel_writes(visa)
+
+        visa.instrument.writes.clear()
+        visa.read_all_channels()
+        assert _channel_writes(visa) == []
+    print("  [PASS] Rejected settings are resent")
+
+
+def test_settings_resent_after_fallback():
+    """Test that falling back to sequential reading forgets what was written to the instrument."""
+    with mock.patch("hardware.visa_interface.time.sleep"):
+        visa = _connected_interface()
+        visa.read_all_channels()
+
+        # read_measurement is stubbed because it takes the interface mutex already held by read_all_channels
+        with mock.patch.object(visa, "start_scan", return_value=False), \
+                mock.patch.object(visa, "read_measurement", return_value=None):
+            visa.read_all_channels()
+
+        visa.instrument.writes.clear()
+        visa.read_all_channels()
+        assert len([c for c in _channel_writes(visa) if c.startswith(":ROUT:CHAN")]) == 16
+        assert len([c for c in _channel_writes(visa) if c.startswith(":ROUT:LIMI")]) == 2
+    print("  [PASS] Settings are resent after a fallback read")
+
+
+def test_settings_resent_after_reconnect():
+    """Test that disconnecting forgets what was written to the instrument."""
+    with mock.patch("hardware.visa_interface.time.sleep"):
+        visa = _connected_interface()
+        visa.read_all_channels()
+        visa.disconnect()
+
+        visa.instrument = RecordingInstrument()
+        visa._connected = True
+        visa.read_all_channels()
+        assert len([c for c in _channel_writes(visa) if c.startswith(":ROUT:CHAN")]) == 16
+        assert len([c for c in _channel_writes(visa) if c.startswith(":ROUT:LIMI")]) == 2
+    print("  [PASS] Settings are resent after reconnecting")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Scan Setting Cache Test Suite")
+    print("=" * 60)
+
+    tests = [
+        test_unchanged_settings_not_resent,
+        test_changed_channel_resent,
+        test_rejected_settings_resent,
+        test_settings_resent_after_fallback,
+        test_settings_resent_after_reconnect,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+        except AssertionError as e:
+            failed += 1
+            print(f"  [FAIL] {test.__name__}: {e}")
+
+    print("=" * 60)
+    if failed:
+        print(f"\n[FAILURE] {failed} test(s) failed!")
+        sys.exit(1)
+    print("\n[SUCCESS] All tests passed!")
+    sys.exit(0)